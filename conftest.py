@@ -1,6 +1,7 @@
 """
 Root conftest.py: stub all homeassistant (HA) modules so beatify game
-logic can be imported and tested without a running HA instance.
+logic can be imported and tested without a running HA instance. When a
+real HA is installed in the environment, the stubs are skipped.
 
 Must live at the repo root — pytest processes it before any test file
 or tests/conftest.py imports happen.
@@ -8,44 +9,71 @@ or tests/conftest.py imports happen.
 
 from __future__ import annotations
 
+import importlib.util
 import sys
 from types import ModuleType
-from unittest.mock import MagicMock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
 
 
 def _make_pkg(name: str) -> ModuleType:
-    """Register a real (empty) package so sub-imports work."""
+    """Build a real (empty) package so sub-imports work."""
     mod = ModuleType(name)
     mod.__path__ = []  # type: ignore[attr-defined]
     mod.__package__ = name
-    sys.modules[name] = mod
     return mod
 
 
-def _make_leaf(name: str) -> MagicMock:
-    """Register a MagicMock leaf module (attribute access is unrestricted)."""
-    mock = MagicMock()
-    mock.__name__ = name
-    mock.__spec__ = None
-    sys.modules[name] = mock
-    return mock
+def _make_leaf(name: str) -> ModuleType | MagicMock:
+    """Build a leaf module stub.
+
+    Plain ``ModuleType`` leaves hand out an empty stub module for any unknown
+    attribute — enough for code that only *references* HA symbols, and far
+    cheaper than a MagicMock that allocates a child mock on every access.
+    Leaves whose functions production code actually calls are MagicMocks.
+    """
+    if name in _MOCK_LEAVES:
+        # Imported here so unittest.mock (and its inspect/pprint deps) only
+        # loads when a MagicMock leaf is actually needed.
+        from unittest.mock import MagicMock  # noqa: PLC0415
+
+        mock = MagicMock()
+        mock.__name__ = name
+        mock.__spec__ = None
+        return mock
+
+    mod = ModuleType(name)
+    mod.__spec__ = None
+
+    def _getattr(attr: str) -> ModuleType:
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        value = ModuleType(f"{name}.{attr}")
+        setattr(mod, attr, value)
+        return value
+
+    mod.__getattr__ = _getattr  # type: ignore[attr-defined]
+    return mod
 
 
 # ---------------------------------------------------------------------------
 # Stub homeassistant package hierarchy
 # ---------------------------------------------------------------------------
 
-_PACKAGES = [
+_PACKAGES = (
     "homeassistant",
     "homeassistant.components",
     "homeassistant.helpers",
     "homeassistant.util",
-]
+)
 
-_LEAVES = [
+_LEAVES = (
     "homeassistant.components.frontend",
     "homeassistant.components.media_player",
     "homeassistant.components.media_player.const",
+    "homeassistant.const",
     "homeassistant.core",
     "homeassistant.config_entries",
     "homeassistant.helpers.aiohttp_client",
@@ -54,15 +82,23 @@ _LEAVES = [
     "homeassistant.helpers.entity",
     "homeassistant.helpers.event",
     "homeassistant.util.dt",
-]
+)
+
+# Leaves whose functions are *called* (not just imported) by code under test,
+# e.g. ``async_track_state_change_event`` — these need MagicMock's callables.
+_MOCK_LEAVES = frozenset(
+    {
+        "homeassistant.helpers.event",
+    }
+)
 
-for _pkg in _PACKAGES:
-    if _pkg not in sys.modules:
-        _make_pkg(_pkg)
 
-for _leaf in _LEAVES:
-    if _leaf not in sys.modules:
-        _make_leaf(_leaf)
+def _stub_ha_hierarchy() -> None:
+    """Install the package and leaf stubs that are not already imported."""
+    # Packages first so the leaves' parents exist.
+    modules = sys.modules
+    modules.update({name: _make_pkg(name) for name in _PACKAGES if name not in modules})
+    modules.update({name: _make_leaf(name) for name in _LEAVES if name not in modules})
 
 
 # `homeassistant.components.http` needs special handling: views inherit from
@@ -99,9 +135,6 @@ def _stub_http_module() -> None:
     sys.modules["homeassistant.components.http"] = http_mod
 
 
-_stub_http_module()
-
-
 # `homeassistant.exceptions` needs real Exception subclasses, not MagicMock
 # attributes — production code does `except (HomeAssistantError, ServiceNotFound)`
 # and Python rejects catch-clauses that aren't actual exception types.
@@ -129,11 +162,28 @@ def _stub_exceptions_module() -> None:
     sys.modules["homeassistant.exceptions"] = exc_mod
 
 
-_stub_exceptions_module()
+def _wire_parent_packages() -> None:
+    """Wire child attributes onto parent packages so `from homeassistant.X import Y` works."""
+    ha = sys.modules["homeassistant"]
+    ha.components = sys.modules["homeassistant.components"]  # type: ignore[attr-defined]
+    ha.helpers = sys.modules["homeassistant.helpers"]  # type: ignore[attr-defined]
+    ha.util = sys.modules["homeassistant.util"]  # type: ignore[attr-defined]
+
+
+def _real_homeassistant_available() -> bool:
+    """Return True if a real Home Assistant is already imported or importable.
+
+    ``find_spec`` only probes the import path — it does not import HA — so
+    the check stays cheap on the common no-HA test image.
+    """
+    if "homeassistant" in sys.modules:
+        return True
+    return importlib.util.find_spec("homeassistant") is not None
 
 
-# Wire child attributes onto parent packages so `from homeassistant.X import Y` works
-_ha = sys.modules["homeassistant"]
-_ha.components = sys.modules["homeassistant.components"]  # type: ignore[attr-defined]
-_ha.helpers = sys.modules["homeassistant.helpers"]  # type: ignore[attr-defined]
-_ha.util = sys.modules["homeassistant.util"]  # type: ignore[attr-defined]
+# Run against a real HA when the environment ships one; stub it otherwise.
+if not _real_homeassistant_available():
+    _stub_ha_hierarchy()
+    _stub_http_module()
+    _stub_exceptions_module()
+    _wire_parent_packages()
@@ -7,20 +7,19 @@ to play music guessing games.
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import importlib
 import json
 import logging
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypedDict
 
-from homeassistant.components.frontend import (
-    async_register_built_in_panel,
-    async_remove_panel,
-)
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.helpers.event import async_track_time_interval
 
-from .analytics import AnalyticsStorage
 from .const import (
     CONF_ENABLE_COMPANION_AUTH_BYPASS,
     DEFAULT_ENABLE_COMPANION_AUTH_BYPASS,
@@ -34,49 +33,72 @@ from .game.playlist import (
 from .game.service import GameService
 from .game.state import GameState
 from .server import async_register_static_paths
-from .server.views import (
-    AdminView,
-    AlbumArtView,
-    AnalyticsPageView,
-    AnalyticsView,
-    BeatifyAuthCallbackView,
-    BeatifyAuthRefreshView,
-    CapabilitiesView,
-    DashboardView,
-    EndGameView,
-    ForceResetView,
-    GameStatusView,
-    LauncherView,
-    LightsView,
-    PreviewLightsView,
-    TtsEntitiesView,
-    TtsTestView,
-    PlayerView,
-    PlaylistRequestsView,
-    MixPlaylistView,
-    SavePlaylistView,
-    SwJsView,
-    RematchGameView,
-    SetSuddenDeathView,
-    SongStatsView,
-    StartGameplayView,
-    StartGameView,
-    StatsView,
-    StatusView,
-    SetupView,
-    UsageView,
-)
-from .server.websocket import BeatifyWebSocketHandler
-from .server.ws_handlers.admin import _finalize_and_end
 from .services.media_player import async_get_media_players
-from .services.stats import StatsService
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant
+
+    from .analytics import AnalyticsStorage  # noqa: F401
+    from .server.views import (  # noqa: F401
+        AdminView,
+        AlbumArtView,
+        AnalyticsPageView,
+        AnalyticsView,
+        BeatifyAuthCallbackView,
+        BeatifyAuthRefreshView,
+        CapabilitiesView,
+        DashboardView,
+        EndGameView,
+        ForceResetView,
+        GameStatusView,
+        LauncherView,
+        LightsView,
+        MixPlaylistView,
+        PlayerView,
+        PlaylistRequestsView,
+        PreviewLightsView,
+        RematchGameView,
+        SavePlaylistView,
+        SetSuddenDeathView,
+        SetupView,
+        SongStatsView,
+        StartGameView,
+        StartGameplayView,
+        StatsView,
+        StatusView,
+        SwJsView,
+        TtsEntitiesView,
+        TtsTestView,
+        UsageView,
+    )
+    from .server.websocket import BeatifyWebSocketHandler  # noqa: F401
+    from .services.stats import StatsService  # noqa: F401
 
 _LOGGER = logging.getLogger(__name__)
 
+
+class BeatifyData(TypedDict, total=False):
+    """Shape of the ``hass.data[DOMAIN]`` record built by async_setup_entry.
+
+    ``total=False`` because other modules stash their own private keys in the
+    same dict (e.g. the playlist discovery cache, #1704), and tests build
+    partial records.
+    """
+
+    entry_id: str
+    version: str
+    media_players: list[dict[str, Any]]
+    playlists: list[dict]
+    playlist_dir: str
+    game: GameState
+    game_service: GameService
+    ws_handler: BeatifyWebSocketHandler
+    stats: StatsService
+    analytics: AnalyticsStorage
+    companion_auth_bypass_enabled: bool
+
+
 # hass.data key (outside DOMAIN, so it survives async_unload_entry popping
 # hass.data[DOMAIN]) guarding one-time HTTP route registration. aiohttp routes
 # cannot be unregistered, so views/WS/static paths must be registered exactly
@@ -84,6 +106,88 @@ _LOGGER = logging.getLogger(__name__)
 # new handlers with stale duplicates (#1364).
 _ROUTES_REGISTERED = f"{DOMAIN}_routes_registered"
 
+# Sidebar panel config (Story 10.3). Points to the launcher page, which opens
+# the game in a new tab (fullscreen, no HA chrome).
+_PANEL_CONFIG: dict[str, str] = {"url": "/beatify/launcher"}
+
+# Module holding every HTTP view class.
+_VIEWS_MODULE = f"{__name__}.server.views"
+
+# HTTP views registered once per HA run, in registration order (#1364). The
+# single source for both route registration and the lazy package attributes
+# below — adding a view means adding its name here.
+_VIEW_NAMES: tuple[str, ...] = (
+    "AdminView",
+    "LauncherView",
+    # Safari 18 /auth/token workaround — server-side OAuth handling, the
+    # frontend never POSTs to auth endpoints (rc15+).
+    "BeatifyAuthCallbackView",
+    "BeatifyAuthRefreshView",
+    "StatusView",
+    "CapabilitiesView",
+    "SetupView",  # #1663 — server-side setup flag
+    "LightsView",  # Issue #331
+    "AlbumArtView",  # Issue #933 — remote album art
+    "PreviewLightsView",  # Issue #408
+    "TtsEntitiesView",  # Issue #1073
+    "TtsTestView",
+    "StartGameView",
+    "StartGameplayView",
+    "SetSuddenDeathView",  # Issue #827
+    "EndGameView",
+    "ForceResetView",  # #777 follow-up — stuck-state escape hatch
+    "RematchGameView",  # Issue #108
+    "PlayerView",
+    "SwJsView",  # #780 — SW at /beatify/sw.js for /beatify/ scope
+    "GameStatusView",
+    "DashboardView",
+    "StatsView",
+    "AnalyticsView",
+    "AnalyticsPageView",
+    "SongStatsView",  # Story 19.7
+    "PlaylistRequestsView",  # Story 44
+    "SavePlaylistView",  # #1057
+    "MixPlaylistView",  # #1538 — Smart Playlist Mixer
+    "UsageView",  # v3.3 Playlist Hub local stats
+)
+
+# Names still reachable as attributes of this package (PEP 562), mapped to the
+# absolute module that defines them. They used to be imported eagerly at module
+# load; resolving them on first access keeps the public surface while the HTTP
+# layer stays out of HA's discovery-time import.
+_LAZY_IMPORTS: dict[str, str] = {
+    **dict.fromkeys(_VIEW_NAMES, _VIEWS_MODULE),
+    "BeatifyWebSocketHandler": f"{__name__}.server.websocket",
+    "StatsService": f"{__name__}.services.stats",
+    "AnalyticsStorage": f"{__name__}.analytics",
+}
+
+
+def _cached_import(module_path: str, attr: str) -> Any:
+    """Return ``attr`` from ``module_path``, importing the module only if needed.
+
+    Most lazy names live in ``server.views``; once that module is loaded the
+    lookup is a plain ``sys.modules`` hit instead of a trip through
+    ``importlib.import_module``.
+    """
+    modules = sys.modules
+    try:
+        module = modules[module_path]
+    except KeyError:
+        module = importlib.import_module(module_path)
+    return getattr(module, attr)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a lazily-imported name on first access and cache it."""
+    try:
+        module_path = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = _cached_import(module_path, name)
+    globals()[name] = value
+    return value
+
 
 def _read_manifest_version() -> str:
     """Read the integration version from manifest.json (executor-safe).
@@ -109,7 +213,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Beatify from a config entry."""
     _LOGGER.debug("Setting up Beatify integration")
 
-    # hass.data[DOMAIN] is assigned wholesale below once discovery + game
+    # The HTTP layer, WebSocket handler and storage-backed services are only
+    # needed once an entry is actually set up. HA imports this module during
+    # integration discovery, so importing them here keeps that cold path cheap
+    # for installs that never configure Beatify.
+    from homeassistant.components.frontend import (  # noqa: PLC0415
+        async_register_built_in_panel,
+    )
+
+    from .analytics import AnalyticsStorage  # noqa: PLC0415
+    from .server.websocket import BeatifyWebSocketHandler  # noqa: PLC0415
+    from .server.ws_handlers.admin import _finalize_and_end  # noqa: PLC0415
+    from .services.stats import StatsService  # noqa: PLC0415
+
+    # hass.data[DOMAIN] is filled in below once discovery + game
     # infrastructure are built, so an early setdefault here is redundant (#1402
     # B6). The only reader before that assignment is _read_manifest_version,
     # which doesn't touch hass.data.
@@ -120,34 +237,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     version = await hass.async_add_executor_job(_read_manifest_version)
     _LOGGER.debug("Beatify version: %s", version)
 
-    # Ensure playlist directory exists
+    # Ensure playlist directory exists. Must finish before discovery: it also
+    # copies the bundled playlists that discovery is about to scan.
     playlist_dir = await async_ensure_playlist_directory(hass)
 
-    # Discover media players and playlists
-    media_players = await async_get_media_players(hass)
-    playlists = await async_discover_playlists(hass)
-
-    _LOGGER.info(
-        "Found %d media players, %d playlists",
-        len(media_players),
-        len(playlists),
+    # Discover media players and playlists. Independent lookups (HA state vs.
+    # a filesystem scan in the executor), so run them concurrently.
+    media_players, playlists = await asyncio.gather(
+        async_get_media_players(hass),
+        async_discover_playlists(hass),
     )
 
+    # HA's default log level is WARNING, so skip building the arguments too.
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(
+            "Found %d media players, %d playlists",
+            len(media_players),
+            len(playlists),
+        )
+
     # Initialize game state
     game_state = GameState()
     game_state.set_hass(hass)
 
-    # Initialize stats service (Story 14.4)
+    # Initialize stats service (Story 14.4) and analytics storage (Story 19.1).
+    # Each load is an independent read of its own storage file, so run them
+    # concurrently.
     stats_service = StatsService(hass)
-    await stats_service.load()
-    _LOGGER.debug(
-        "Stats service initialized: %d games played", stats_service.games_played
-    )
-
-    # Initialize analytics storage (Story 19.1)
     analytics = AnalyticsStorage(hass)
-    await analytics.load()
-    _LOGGER.debug("Analytics initialized: %d games recorded", analytics.total_games)
+    await asyncio.gather(stats_service.load(), analytics.load())
+    # games_played / total_games are properties (total_games sums the monthly
+    # summaries), so only evaluate them when the lines will actually be logged.
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Stats service initialized: %d games played", stats_service.games_played
+        )
+        _LOGGER.debug("Analytics initialized: %d games recorded", analytics.total_games)
 
     # Connect analytics to stats service for unified data collection
     stats_service.set_analytics(analytics)
@@ -185,7 +310,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     # Store discovery results and game infrastructure
-    hass.data[DOMAIN] = {
+    domain_data: BeatifyData = {
         "entry_id": entry.entry_id,
         "version": version,  # #784 — single source of truth from manifest.json
         "media_players": media_players,
@@ -198,11 +323,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "analytics": analytics,
         "companion_auth_bypass_enabled": companion_auth_bypass_enabled,
     }
+    # Playlist discovery above has already created hass.data[DOMAIN] to memoise
+    # its parse (#1704). Fill that dict in rather than replacing it, so the
+    # first playlist request after setup is a cache hit instead of a re-scan.
+    hass.data.setdefault(DOMAIN, {}).update(domain_data)
 
     # #1357: refresh the bypass flag in place when the options change. No full
     # reload is needed — companion_auth.py reads hass.data live per request.
     entry.async_on_unload(entry.add_update_listener(_async_update_options))
 
+    # Config entries are not unloaded when HA stops, so the flush in
+    # async_unload_entry never runs on shutdown. Flush the coalesced analytics
+    # and stats saves from the stop event instead so they aren't lost.
+    async def _async_flush_on_stop(_event: Event) -> None:
+        await asyncio.gather(analytics.async_shutdown(), stats_service.async_shutdown())
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_on_stop)
+    )
+
     # #1865: server-side round backstop. The round timer is a single asyncio
     # task owned by the round; if it is cancelled, raises, or blocks in the
     # time-up announcement, nothing on the server notices and the game sits on
@@ -236,42 +375,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # the WS route below dispatches to the *current* handler in hass.data, so a
     # single registration keeps working across reloads.
     if not hass.data.get(_ROUTES_REGISTERED):
-        hass.http.register_view(AdminView(hass))
-        hass.http.register_view(LauncherView(hass))
-        # Safari 18 /auth/token workaround — server-side OAuth handling, the
-        # frontend never POSTs to auth endpoints (rc15+).
-        hass.http.register_view(BeatifyAuthCallbackView(hass))
-        hass.http.register_view(BeatifyAuthRefreshView(hass))
-        hass.http.register_view(StatusView(hass))
-        hass.http.register_view(CapabilitiesView(hass))
-        hass.http.register_view(SetupView(hass))  # #1663 — server-side setup flag
-        hass.http.register_view(LightsView(hass))  # Issue #331
-        hass.http.register_view(AlbumArtView(hass))  # Issue #933 — remote album art
-        hass.http.register_view(PreviewLightsView(hass))  # Issue #408
-        hass.http.register_view(TtsEntitiesView(hass))  # Issue #1073
-        hass.http.register_view(TtsTestView(hass))
-        hass.http.register_view(StartGameView(hass))
-        hass.http.register_view(StartGameplayView(hass))
-        hass.http.register_view(SetSuddenDeathView(hass))  # Issue #827
-        hass.http.register_view(EndGameView(hass))
-        hass.http.register_view(
-            ForceResetView(hass)
-        )  # #777 follow-up — stuck-state escape hatch
-        hass.http.register_view(RematchGameView(hass))  # Issue #108
-        hass.http.register_view(PlayerView(hass))
-        hass.http.register_view(
-            SwJsView(hass)
-        )  # #780 — SW at /beatify/sw.js for /beatify/ scope
-        hass.http.register_view(GameStatusView(hass))
-        hass.http.register_view(DashboardView(hass))
-        hass.http.register_view(StatsView(hass))
-        hass.http.register_view(AnalyticsView(hass))
-        hass.http.register_view(AnalyticsPageView(hass))
-        hass.http.register_view(SongStatsView(hass))  # Story 19.7
-        hass.http.register_view(PlaylistRequestsView(hass))  # Story 44
-        hass.http.register_view(SavePlaylistView(hass))  # #1057
-        hass.http.register_view(MixPlaylistView(hass))  # #1538 — Smart Playlist Mixer
-        hass.http.register_view(UsageView(hass))  # v3.3 Playlist Hub local stats
+        register_view = hass.http.register_view
+        for view_name in _VIEW_NAMES:
+            register_view(_cached_import(_VIEWS_MODULE, view_name)(hass))
 
         # Register WebSocket endpoint via a stable dispatch closure that
         # resolves the *current* handler from hass.data at call time (#1364).
@@ -301,14 +407,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     # Register sidebar panel (Story 10.3)
-    # Points to launcher page which opens game in a new tab (fullscreen, no HA chrome)
     async_register_built_in_panel(
         hass,
         component_name="iframe",
         sidebar_title="Beatify",
         sidebar_icon="mdi:music-circle",
         frontend_url_path="beatify",
-        config={"url": "/beatify/launcher"},
+        config=_PANEL_CONFIG,
         require_admin=False,
     )
     _LOGGER.debug("Beatify sidebar panel registered")
@@ -375,6 +480,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     if unload_ok:
+        from homeassistant.components.frontend import (  # noqa: PLC0415
+            async_remove_panel,
+        )
+
         # Remove sidebar panel (Story 10.3)
         try:
             async_remove_panel(hass, "beatify")
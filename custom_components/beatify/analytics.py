@@ -8,15 +8,21 @@ enabling historical analysis through the analytics dashboard.
 from __future__ import annotations
 
 import asyncio
-import json
+import bisect
+import calendar
+import heapq
 import logging
 import os
 import time
-from datetime import datetime, timezone
+from collections import Counter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypedDict, cast
 
+import orjson
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,8 +43,17 @@ MAX_ERROR_RECORDS = 500
 # delay-coalesce them into a single write. (#1388)
 ERROR_SAVE_DEBOUNCE_SECONDS = 5.0
 
+SECONDS_PER_DAY = 86400
+
+# Sentinel returned by AnalyticsStorage._read_file when no file exists yet.
+_NO_FILE = object()
+
 # Period-to-days mapping used by stats functions
 PERIOD_DAYS_MAP: dict[str, int] = {"7d": 7, "30d": 30, "90d": 90, "all": 365 * 10}
+# Same mapping in seconds, resolved once instead of per stats call.
+_PERIOD_SECONDS: dict[str, int] = {
+    period: days * SECONDS_PER_DAY for period, days in PERIOD_DAYS_MAP.items()
+}
 
 
 class GameRecord(TypedDict):
@@ -93,6 +108,67 @@ class AnalyticsData(TypedDict):
     monthly_summaries: list[MonthlySummary]
 
 
+def _game_ended_at(game: GameRecord) -> int:
+    """Sort/bisect key for the games list (kept ascending by end time)."""
+    return game.get("ended_at", 0)
+
+
+def _error_timestamp(error: ErrorEvent) -> int:
+    """Sort/bisect key for the errors list (kept ascending by timestamp)."""
+    return error.get("timestamp", 0)
+
+
+def _time_slice(
+    records: list[Any],
+    key: Callable[[Any], int],
+    start_date: int | None,
+    end_date: int | None,
+) -> list[Any]:
+    """Return the records within [start_date, end_date] (inclusive bounds).
+
+    ``records`` must be ascending by ``key``, so the range is one slice found
+    by two bisects rather than a filter over the whole list.
+    """
+    lo = 0 if start_date is None else bisect.bisect_left(records, start_date, key=key)
+    hi = (
+        len(records)
+        if end_date is None
+        else bisect.bisect_right(records, end_date, key=key)
+    )
+    return records[lo:hi]
+
+
+def _utc_year_month(timestamp: float) -> tuple[int, int]:
+    """Return the UTC (year, month) of a Unix timestamp using integer math.
+
+    Howard Hinnant's days-to-civil algorithm, avoiding a datetime object (and
+    a strftime) per record when bucketing games by month.
+    """
+    z = int(timestamp) // SECONDS_PER_DAY + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    month = mp + 3 if mp < 10 else mp - 9
+    return yoe + era * 400 + (month <= 2), month
+
+
+def _fold_games(games: list[GameRecord]) -> tuple[int, int, float, int]:
+    """Sum players, rounds and player-weighted score, and track the peak
+    player count, in a single pass over ``games``."""
+    total_players = total_rounds = peak_players = 0
+    total_score = 0.0
+    for g in games:
+        players = g["player_count"]
+        total_players += players
+        total_rounds += g["rounds_played"]
+        total_score += g["average_score"] * players
+        if players > peak_players:
+            peak_players = players
+    return total_players, total_rounds, total_score, peak_players
+
+
 class AnalyticsStorage:
     """
     Analytics storage with async file I/O and atomic writes.
@@ -117,10 +193,18 @@ class AnalyticsStorage:
         self._save_lock = asyncio.Lock()
         # Pending debounced error-save timer handle (#1388)
         self._error_save_handle: asyncio.TimerHandle | None = None
+        # In-flight save task, plus a dirty flag set when schedule_save() is
+        # called while it runs; the done-callback then issues one follow-up
+        # save instead of stacking a save task per event.
+        self._save_task: asyncio.Task | None = None
+        self._save_dirty = False
         self._playlist_display_names: dict[str, str] | None = None
+        # Bumped on every mutation that can change computed metrics; a cached
+        # result is only reused while its generation is still current.
+        self._generation = 0
         self._metrics_cache: dict[
-            str, tuple[float, dict]
-        ] = {}  # period -> (timestamp, result)
+            str, tuple[int, float, dict]
+        ] = {}  # period -> (generation, timestamp, result)
 
     def _empty_data(self) -> AnalyticsData:
         """Return empty analytics data structure."""
@@ -142,13 +226,8 @@ class AnalyticsStorage:
         ``analytics.json.corrupt`` rather than being destroyed.
         """
         try:
-            if not self._path.exists():
-                _LOGGER.debug("No analytics file found, starting fresh")
-                self._data = self._empty_data()
-                return
-
             try:
-                content = await self._hass.async_add_executor_job(self._path.read_text)
+                parsed = await self._hass.async_add_executor_job(self._read_file)
             except OSError as err:
                 # The file exists but is unreadable (permissions, transient I/O
                 # error). Start fresh in memory so startup isn't blocked, but do
@@ -160,13 +239,15 @@ class AnalyticsStorage:
                 )
                 self._data = self._empty_data()
                 return
-
-            try:
-                parsed = json.loads(content)
-            except json.JSONDecodeError as err:
+            except orjson.JSONDecodeError as err:
                 await self._quarantine_corrupt_file(err)
                 return
 
+            if parsed is _NO_FILE:
+                _LOGGER.debug("No analytics file found, starting fresh")
+                self._data = self._empty_data()
+                return
+
             if not isinstance(parsed, dict):
                 await self._quarantine_corrupt_file(
                     TypeError(
@@ -176,6 +257,12 @@ class AnalyticsStorage:
                 return
 
             self._data = cast("AnalyticsData", parsed)
+            # get_games/get_errors bisect on timestamp. Records are appended in
+            # time order, but a file from an older version or a clock step can
+            # leave them out of sequence — restore the order once here (a
+            # near-linear pass when already sorted).
+            self._data.get("games", []).sort(key=_game_ended_at)
+            self._data.get("errors", []).sort(key=_error_timestamp)
             _LOGGER.debug(
                 "Loaded analytics: %d games, %d errors",
                 len(self._data.get("games", [])),
@@ -193,6 +280,18 @@ class AnalyticsStorage:
             # event loop. See #1387.
             await self._hass.async_add_executor_job(self._get_playlist_display_names)
 
+    def _read_file(self) -> Any:
+        """Stat, read and parse the analytics file (runs in the executor).
+
+        Returns ``_NO_FILE`` when there is no file yet. Read errors
+        (``OSError``) and parse errors (``orjson.JSONDecodeError``) propagate
+        so ``load`` can tell an unreadable file from a corrupt one. Parsing here
+        keeps both the stat and the decode of the whole history off the loop.
+        """
+        if not self._path.exists():
+            return _NO_FILE
+        return orjson.loads(self._path.read_bytes())
+
     async def _quarantine_corrupt_file(self, err: Exception) -> None:
         """Move an unparseable analytics file aside and start fresh (#1385).
 
@@ -215,11 +314,33 @@ class AnalyticsStorage:
         self._data = self._empty_data()
         await self._save()
 
+    def _snapshot(self) -> AnalyticsData:
+        """Return a copy of the store that is safe to encode off the event loop.
+
+        Game and error records are never mutated after they are appended, so
+        copying the lists is enough for them. Monthly summaries ARE updated in
+        place by the prune pass, so those dicts are copied too. The copy is a
+        pointer walk over at most MAX_DETAILED_RECORDS + MAX_ERROR_RECORDS
+        entries — far cheaper than the JSON encode it takes off the loop.
+        """
+        data = self._data
+        return cast(
+            "AnalyticsData",
+            {
+                **data,
+                "games": list(data["games"]),
+                "errors": list(data["errors"]),
+                "monthly_summaries": [dict(s) for s in data["monthly_summaries"]],
+            },
+        )
+
     async def _save(self) -> None:
         """
         Persist analytics data with atomic write (AC: #3).
 
-        Uses temp file + rename for crash safety.
+        Uses temp file + rename for crash safety. The store is snapshotted on
+        the event loop and the JSON encode runs in the executor together with
+        the write, so a save never serializes the whole history on the loop.
         """
         async with self._save_lock:
             try:
@@ -230,10 +351,20 @@ class AnalyticsStorage:
 
                 # Write to temp file first (atomic write pattern)
                 temp_path = self._path.with_suffix(".tmp")
-                content = json.dumps(self._data, indent=2)
+                snapshot = self._snapshot()
 
                 def _write_atomic() -> None:
-                    temp_path.write_text(content)
+                    # Compact orjson output: the file is machine-read only, so
+                    # indentation just doubled its size and the encode time.
+                    content = orjson.dumps(snapshot)
+                    with open(temp_path, "wb") as temp_file:
+                        temp_file.write(content)
+                        temp_file.flush()
+                        # Data must be on disk before the rename, or a crash
+                        # can leave analytics.json pointing at an empty file.
+                        # The parent directory is not fsynced: saves are
+                        # coalesced, and losing the last rename is acceptable.
+                        os.fsync(temp_file.fileno())
                     # Atomic rename (POSIX guarantees atomicity)
                     os.replace(temp_path, self._path)
 
@@ -247,15 +378,24 @@ class AnalyticsStorage:
         """
         Schedule non-blocking save (AC: #4).
 
-        Uses fire-and-forget pattern to avoid blocking game operations.
+        Uses fire-and-forget pattern to avoid blocking game operations. Calls
+        arriving while a save is in flight only mark the store dirty; the
+        in-flight save's done-callback then runs a single follow-up save, so a
+        burst of N events costs at most two writes rather than N queued saves.
         """
-        task = asyncio.create_task(self._save())
-        task.add_done_callback(self._handle_save_error)
+        if self._save_task is not None and not self._save_task.done():
+            self._save_dirty = True
+            return
+        self._save_dirty = False
+        self._save_task = asyncio.create_task(self._save())
+        self._save_task.add_done_callback(self._handle_save_done)
 
-    def _handle_save_error(self, task: asyncio.Task) -> None:
-        """Log exceptions from fire-and-forget save tasks."""
+    def _handle_save_done(self, task: asyncio.Task) -> None:
+        """Log save-task errors and re-schedule if mutated mid-save."""
         if (exc := task.exception()) is not None:
             _LOGGER.error("Unhandled error in analytics save task: %s", exc)
+        if self._save_dirty:
+            self.schedule_save()
 
     def _schedule_error_save(self) -> None:
         """
@@ -290,6 +430,11 @@ class AnalyticsStorage:
             self._error_save_handle.cancel()
             self._error_save_handle = None
             await self._save()
+        elif self._save_dirty:
+            # A save was requested while another was in flight; write now
+            # rather than relying on a done-callback that may never run.
+            self._save_dirty = False
+            await self._save()
 
     async def add_game(self, record: GameRecord) -> None:
         """
@@ -299,8 +444,10 @@ class AnalyticsStorage:
             record: Game record to store
 
         """
-        self._data["games"].append(record)
-        self._metrics_cache.clear()
+        # insort keeps the list ordered by end time; for the usual in-order
+        # record it lands at the end, so this is effectively an append.
+        bisect.insort(self._data["games"], record, key=_game_ended_at)
+        self._generation += 1
         self._games_since_prune += 1
 
         # Prune periodically
@@ -332,13 +479,15 @@ class AnalyticsStorage:
             "message": message[:500],  # Limit message length
         }
         errors = self._data["errors"]
-        errors.append(event)
+        bisect.insort(errors, event, key=_error_timestamp)
         # Cap independently of the game-driven prune, which most installs never
         # trigger. Keep only the most recent MAX_ERROR_RECORDS events so a burst
         # cannot grow the list (and the per-save json.dumps) without bound.
         if len(errors) > MAX_ERROR_RECORDS:
             del errors[:-MAX_ERROR_RECORDS]
         self._session_error_count += 1
+        # Error stats are part of compute_metrics; don't serve them stale.
+        self._generation += 1
         # Debounce/coalesce the save instead of a full-file rewrite per event.
         self._schedule_error_save()
 
@@ -385,21 +534,27 @@ class AnalyticsStorage:
             return
 
         # Group old games by month and create summaries
-        monthly_groups: dict[str, list[GameRecord]] = {}
+        games_by_month: dict[tuple[int, int], list[GameRecord]] = {}
         for game in old_games:
-            dt = datetime.fromtimestamp(game.get("ended_at", 0), tz=timezone.utc)
-            month_key = dt.strftime("%Y-%m")
-            if month_key not in monthly_groups:
-                monthly_groups[month_key] = []
-            monthly_groups[month_key].append(game)
+            month_key = _utc_year_month(game.get("ended_at", 0))
+            if month_key not in games_by_month:
+                games_by_month[month_key] = []
+            games_by_month[month_key].append(game)
+        # Format the "%Y-%m" key once per month rather than once per game.
+        monthly_groups = {
+            f"{year:04d}-{month:02d}": month_games
+            for (year, month), month_games in games_by_month.items()
+        }
+
+        # Index existing summaries by month once instead of scanning the list
+        # per month. Built in reverse so a (hand-edited) duplicate month keeps
+        # resolving to its first entry, as the previous linear scan did.
+        summaries = self._data["monthly_summaries"]
+        summaries_by_month = {s.get("month"): s for s in reversed(summaries)}
 
         # Create monthly summaries
         for month, month_games in monthly_groups.items():
-            # Check if summary already exists
-            existing = next(
-                (s for s in self._data["monthly_summaries"] if s.get("month") == month),
-                None,
-            )
+            existing = summaries_by_month.get(month)
             if existing:
                 # Update existing summary
                 existing["games_count"] += len(month_games)
@@ -445,7 +600,8 @@ class AnalyticsStorage:
                     "total_errors": total_errors,
                     "error_rate": round(total_errors / games_count, 2),
                 }
-                self._data["monthly_summaries"].append(summary)
+                summaries.append(summary)
+                summaries_by_month[month] = summary
 
         # Keep only recent games
         self._data["games"] = recent_games
@@ -477,14 +633,8 @@ class AnalyticsStorage:
             Filtered list of game records
 
         """
-        games = self._data["games"]
-
-        if start_date is not None:
-            games = [g for g in games if g["ended_at"] >= start_date]
-        if end_date is not None:
-            games = [g for g in games if g["ended_at"] <= end_date]
-
-        return games
+        # The list is kept sorted by ended_at, so the range is one slice.
+        return _time_slice(self._data["games"], _game_ended_at, start_date, end_date)
 
     def get_errors(
         self, start_date: int | None = None, end_date: int | None = None
@@ -500,14 +650,8 @@ class AnalyticsStorage:
             Filtered list of error events
 
         """
-        errors = self._data["errors"]
-
-        if start_date is not None:
-            errors = [e for e in errors if e["timestamp"] >= start_date]
-        if end_date is not None:
-            errors = [e for e in errors if e["timestamp"] <= end_date]
-
-        return errors
+        # The list is kept sorted by timestamp, so the range is one slice.
+        return _time_slice(self._data["errors"], _error_timestamp, start_date, end_date)
 
     @property
     def total_games(self) -> int:
@@ -595,27 +739,35 @@ class AnalyticsStorage:
             return self._playlist_display_names
 
         display_names: dict[str, str] = {}
-        playlist_dir = Path(
-            self._hass.config.path("custom_components/beatify/playlists")
-        )
+        playlist_dir = self._hass.config.path("custom_components/beatify/playlists")
 
-        if not playlist_dir.exists():
+        # One scandir pass instead of an exists() stat plus a glob. The bundled
+        # directory only changes on upgrade (which restarts HA), so the result
+        # stays memoised for the process lifetime rather than re-statting it.
+        try:
+            with os.scandir(playlist_dir) as entries:
+                json_files = [
+                    (entry.name[: -len(".json")], entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".json")
+                ]
+        except OSError:
             _LOGGER.debug("Playlist directory not found: %s", playlist_dir)
-            # Cache the empty result so the blocking exists() stat does not run
-            # on every subsequent call. See #1387.
+            # Cache the empty result so the blocking directory scan does not
+            # run on every subsequent call. See #1387.
             self._playlist_display_names = display_names
             return display_names
 
-        for json_file in playlist_dir.glob("*.json"):
+        for slug, file_path in json_files:
             try:
-                data = json.loads(json_file.read_text(encoding="utf-8"))
-                slug = json_file.stem  # filename without .json
+                with open(file_path, "rb") as playlist_file:
+                    data = orjson.loads(playlist_file.read())
                 if "name" in data:
                     display_names[slug] = data["name"]
                 else:
                     display_names[slug] = slug  # fallback to slug
-            except (json.JSONDecodeError, OSError) as err:
-                _LOGGER.warning("Failed to read playlist %s: %s", json_file, err)
+            except (orjson.JSONDecodeError, OSError) as err:
+                _LOGGER.warning("Failed to read playlist %s: %s", file_path, err)
 
         self._playlist_display_names = display_names
         _LOGGER.debug("Loaded %d playlist display names", len(display_names))
@@ -632,19 +784,17 @@ class AnalyticsStorage:
             Top 5 playlists with name, play_count, percentage
 
         """
-        playlist_counts: dict[str, int] = {}
-
-        for game in games:
-            for playlist_name in game.get("playlist_names", []):
-                playlist_counts[playlist_name] = (
-                    playlist_counts.get(playlist_name, 0) + 1
-                )
+        playlist_counts = Counter(
+            playlist_name
+            for game in games
+            for playlist_name in game.get("playlist_names", [])
+        )
 
-        # Sort by count descending
-        sorted_playlists = sorted(
-            playlist_counts.items(),
-            key=lambda x: (-x[1], x[0]),  # Count desc, then name asc for ties
-        )[:5]  # Top 5
+        # Top 5 by count descending, then name ascending for ties. A bounded
+        # heap selection instead of sorting every playlist.
+        sorted_playlists = heapq.nsmallest(
+            5, playlist_counts.items(), key=lambda x: (-x[1], x[0])
+        )
 
         # Calculate percentage relative to total games with playlists
         total = sum(count for _, count in sorted_playlists)
@@ -665,7 +815,7 @@ class AnalyticsStorage:
         ]
 
     def compute_games_over_time(
-        self, games: list[GameRecord], period: str
+        self, games: list[GameRecord], period: str, now: int | None = None
     ) -> dict[str, Any]:
         """
         Aggregate game counts for chart visualization (Story 19.5).
@@ -673,112 +823,104 @@ class AnalyticsStorage:
         Args:
             games: List of game records
             period: Time period for granularity
+            now: Reference timestamp; defaults to the current time
 
         Returns:
             Chart data with labels, values, and granularity
 
         """
-        from datetime import timedelta  # noqa: PLC0415
-
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = int(time.time())
+        # Bucket on integer UTC epoch days rather than formatting a date string
+        # per game. Labels come from the bucket keys themselves, so no date
+        # object or strftime is needed at all.
+        today = now // SECONDS_PER_DAY
 
         if period == "7d":
             # Daily aggregation
             days = 7
             granularity = "day"
-            buckets = {
-                (now - timedelta(days=i)).strftime("%Y-%m-%d"): 0 for i in range(days)
-            }
+            day_buckets = dict.fromkeys(range(today - days + 1, today + 1), 0)
 
             for game in games:
-                dt = datetime.fromtimestamp(game["ended_at"], tz=timezone.utc)
-                key = dt.strftime("%Y-%m-%d")
-                if key in buckets:
-                    buckets[key] += 1
-
-            labels = [
-                (now - timedelta(days=i)).strftime("%a")
-                for i in range(days - 1, -1, -1)
-            ]
-            values = [
-                buckets[(now - timedelta(days=i)).strftime("%Y-%m-%d")]
-                for i in range(days - 1, -1, -1)
-            ]
+                day = int(game["ended_at"]) // SECONDS_PER_DAY
+                if day in day_buckets:
+                    day_buckets[day] += 1
+
+            # Epoch day 0 was a Thursday (weekday 3).
+            labels = [calendar.day_abbr[(day + 3) % 7] for day in day_buckets]
+            values = list(day_buckets.values())
 
         elif period in ("30d", "90d"):
-            # Weekly aggregation
+            # Weekly aggregation on Monday-aligned week numbers. Epoch day 0
+            # (1970-01-01) was a Thursday, so shifting by 3 puts each Monday on
+            # a multiple of 7.
             weeks = 4 if period == "30d" else 13
             granularity = "week"
-            week_buckets: dict[str, int] = {}
-
-            for i in range(weeks):
-                week_start = now - timedelta(days=now.weekday() + 7 * i)
-                week_buckets[week_start.strftime("%Y-%m-%d")] = 0
-
-            # Oldest bucket key — used to clamp any game that falls before the
-            # first bucket so its count isn't silently dropped (#1402). Without
-            # this, games in the oldest partial week (or any out-of-range game)
-            # vanished and the chart sum no longer matched total_games.
-            oldest_key = min(week_buckets)
+            this_week = (today + 3) // 7
+            oldest_week = this_week - weeks + 1
+            week_buckets = dict.fromkeys(range(oldest_week, this_week + 1), 0)
 
             for game in games:
-                dt = datetime.fromtimestamp(game["ended_at"], tz=timezone.utc)
-                week_start = dt - timedelta(days=dt.weekday())
-                key = week_start.strftime("%Y-%m-%d")
-                if key in week_buckets:
-                    week_buckets[key] += 1
-                elif key < oldest_key:
+                week = (int(game["ended_at"]) // SECONDS_PER_DAY + 3) // 7
+                if week in week_buckets:
+                    week_buckets[week] += 1
+                elif week < oldest_week:
                     # Older than the chart window's first bucket: fold into the
-                    # oldest bucket so the totals stay consistent.
-                    week_buckets[oldest_key] += 1
+                    # oldest bucket so its count isn't silently dropped and the
+                    # chart sum keeps matching total_games (#1402).
+                    week_buckets[oldest_week] += 1
 
-            sorted_keys = sorted(week_buckets.keys())
-            labels = [f"W{i + 1}" for i in range(len(sorted_keys))]
-            values = [week_buckets[k] for k in sorted_keys]
+            labels = [f"W{i + 1}" for i in range(weeks)]
+            values = list(week_buckets.values())
 
         else:  # "all"
             # Monthly aggregation
             granularity = "month"
-            month_buckets: dict[str, int] = {}
+            month_buckets: dict[tuple[int, int], int] = {}
 
             for game in games:
-                dt = datetime.fromtimestamp(game["ended_at"], tz=timezone.utc)
-                key = dt.strftime("%Y-%m")
+                key = _utc_year_month(game["ended_at"])
                 month_buckets[key] = month_buckets.get(key, 0) + 1
 
-            sorted_keys = sorted(month_buckets.keys())[-12:]  # Last 12 months
-            labels = (
-                [datetime.strptime(k, "%Y-%m").strftime("%b") for k in sorted_keys]
-                if sorted_keys
-                else []
-            )
-            values = [month_buckets[k] for k in sorted_keys] if sorted_keys else []
+            sorted_months = sorted(month_buckets)[-12:]  # Last 12 months
+            labels = [calendar.month_abbr[m] for _, m in sorted_months]
+            values = [month_buckets[k] for k in sorted_months]
 
         return {"labels": labels, "values": values, "granularity": granularity}
 
     def compute_error_stats(
-        self, games: list[GameRecord], errors: list[ErrorEvent], period: str
+        self,
+        games: list[GameRecord],
+        errors: list[ErrorEvent],
+        period: str,
+        now: int | None = None,
     ) -> dict[str, Any]:
         """
         Compute error statistics for the given period (Story 19.6).
 
         Args:
             games: List of game records
-            errors: List of error events
+            errors: List of error events, ascending by timestamp (the order
+                the store keeps them in)
             period: Time period
+            now: Reference timestamp; defaults to the current time
 
         Returns:
             Error stats with rate, count, status, and recent errors
 
         """
-        now = int(time.time())
+        if now is None:
+            now = int(time.time())
 
         # Calculate period boundaries
-        days = PERIOD_DAYS_MAP.get(period, 30)
-        start_ts = now - (days * 86400)
+        start_ts = now - _PERIOD_SECONDS.get(period, _PERIOD_SECONDS["30d"])
 
-        # Filter errors by period
-        period_errors = [e for e in errors if e["timestamp"] >= start_ts]
+        # Filter errors by period: the list is time-ordered, so the period is
+        # its tail from the first error at or after start_ts.
+        period_errors = errors[
+            bisect.bisect_left(errors, start_ts, key=_error_timestamp) :
+        ]
 
         # Calculate total events (games * avg rounds as rough estimate)
         total_events = sum(g.get("rounds_played", 10) for g in games)
@@ -794,10 +936,9 @@ class AnalyticsStorage:
         else:
             status = "critical"
 
-        # Recent errors (last 10)
-        recent_errors = sorted(
-            period_errors, key=lambda e: e["timestamp"], reverse=True
-        )[:10]
+        # Recent errors (last 10, newest first) — already time-ordered, so no
+        # sort is needed.
+        recent_errors = period_errors[-10:][::-1]
 
         return {
             "error_rate": round(error_rate, 4),
@@ -818,35 +959,93 @@ class AnalyticsStorage:
             Dict with computed metrics and trend data
 
         """
-        # Check TTL-based cache (60s) before recomputing
-        cache_key = period
-        if cache_key in self._metrics_cache:
-            cached_ts, cached_result = self._metrics_cache[cache_key]
-            if time.time() - cached_ts < 60:
+        clock = time.time()
+        if (cached := self._cached_metrics(period, clock)) is not None:
+            return cached
+        generation = self._generation
+        now = int(clock)
+        result = self._build_metrics(period, now, *self._metrics_inputs(period, now))
+        self._metrics_cache[period] = (generation, clock, result)
+        return result
+
+    async def async_compute_metrics(self, period: str = "30d") -> dict[str, Any]:
+        """
+        Compute dashboard metrics in the executor (Story 19.2).
+
+        Same result as ``compute_metrics``. The cache check and the range
+        slicing run on the event loop, which leaves the executor with private
+        snapshot lists (records are never mutated once stored), so a game or
+        error recorded meanwhile can't race the aggregation.
+        """
+        clock = time.time()
+        if (cached := self._cached_metrics(period, clock)) is not None:
+            return cached
+        generation = self._generation
+        now = int(clock)
+        games, errors = self._metrics_inputs(period, now)
+        result = await self._hass.async_add_executor_job(
+            self._build_metrics, period, now, games, errors
+        )
+        self._metrics_cache[period] = (generation, clock, result)
+        return result
+
+    def _cached_metrics(self, period: str, clock: float) -> dict[str, Any] | None:
+        """Return the cached metrics for ``period`` if still valid, else None.
+
+        A cached result is reused while no game/error has been recorded since
+        it was computed. The 60s TTL still applies because the period windows
+        slide with the clock even when the data doesn't change.
+        """
+        if period in self._metrics_cache:
+            cached_gen, cached_ts, cached_result = self._metrics_cache[period]
+            if cached_gen == self._generation and clock - cached_ts < 60:
                 return cached_result
+        return None
+
+    def _metrics_inputs(
+        self, period: str, now: int
+    ) -> tuple[list[GameRecord], list[ErrorEvent]]:
+        """Slice the games and errors that the current and previous period of
+        ``period`` can touch. The slices are copies, safe to hand to a worker."""
+        period_seconds = _PERIOD_SECONDS.get(period, _PERIOD_SECONDS["30d"])
+        previous_start = now - 2 * period_seconds
+        return (
+            self.get_games(start_date=previous_start),
+            self.get_errors(start_date=previous_start),
+        )
 
-        now = int(time.time())
+    def _build_metrics(
+        self,
+        period: str,
+        now: int,
+        games: list[GameRecord],
+        errors: list[ErrorEvent],
+    ) -> dict[str, Any]:
+        """Aggregate the metrics payload from time-ordered games/errors.
 
+        Reads nothing from ``self._data``, so it can run in the executor.
+        """
         # Calculate period boundaries
-        days = PERIOD_DAYS_MAP.get(period, 30)
+        period_seconds = _PERIOD_SECONDS.get(period, _PERIOD_SECONDS["30d"])
 
-        current_start = now - (days * 86400)
-        previous_start = current_start - (days * 86400)
+        current_start = now - period_seconds
+        previous_start = current_start - period_seconds
 
         # Get games for current and previous periods
-        current_games = self.get_games(start_date=current_start, end_date=now)
-        previous_games = self.get_games(
-            start_date=previous_start, end_date=current_start - 1
+        current_games = _time_slice(games, _game_ended_at, current_start, now)
+        previous_games = _time_slice(
+            games, _game_ended_at, previous_start, current_start - 1
         )
 
         # Get errors for current period
-        current_errors = self.get_errors(start_date=current_start, end_date=now)
+        current_errors = _time_slice(errors, _error_timestamp, current_start, now)
 
         # Compute current period metrics
+        # Story 19.8: peak concurrent players is folded into the same pass.
         total_games = len(current_games)
-        total_players = sum(g["player_count"] for g in current_games)
-        total_rounds = sum(g["rounds_played"] for g in current_games)
-        total_score = sum(g["average_score"] * g["player_count"] for g in current_games)
+        total_players, total_rounds, total_score, peak_players = _fold_games(
+            current_games
+        )
         total_errors = len(current_errors)
 
         avg_players = total_players / total_games if total_games > 0 else 0
@@ -859,13 +1058,11 @@ class AnalyticsStorage:
 
         # Compute previous period metrics for trends
         prev_total_games = len(previous_games)
-        prev_total_players = sum(g["player_count"] for g in previous_games)
-        prev_total_rounds = sum(g["rounds_played"] for g in previous_games)
-        prev_total_score = sum(
-            g["average_score"] * g["player_count"] for g in previous_games
+        prev_total_players, prev_total_rounds, prev_total_score, _ = _fold_games(
+            previous_games
         )
-        prev_errors = self.get_errors(
-            start_date=previous_start, end_date=current_start - 1
+        prev_errors = _time_slice(
+            errors, _error_timestamp, previous_start, current_start - 1
         )
         prev_total_errors = len(prev_errors)
 
@@ -892,15 +1089,10 @@ class AnalyticsStorage:
 
         # Compute additional data for dashboard sections
         playlists = self.compute_playlist_stats(current_games)
-        chart_data = self.compute_games_over_time(current_games, period)
-        error_stats = self.compute_error_stats(
-            current_games, self._data["errors"], period
-        )
-
-        # Story 19.8: Calculate peak concurrent players
-        peak_players = max((g["player_count"] for g in current_games), default=0)
+        chart_data = self.compute_games_over_time(current_games, period, now=now)
+        error_stats = self.compute_error_stats(current_games, errors, period, now=now)
 
-        result = {
+        return {
             "period": period,
             "total_games": total_games,
             "avg_players_per_game": round(avg_players, 1),
@@ -927,9 +1119,6 @@ class AnalyticsStorage:
             "generated_at": now,
         }
 
-        self._metrics_cache[cache_key] = (time.time(), result)
-        return result
-
     def compute_streak_stats(
         self, period: str = "30d", games: list | None = None
     ) -> dict[str, Any]:
@@ -948,8 +1137,7 @@ class AnalyticsStorage:
             now = int(time.time())
 
             # Calculate period boundaries
-            days = PERIOD_DAYS_MAP.get(period, 30)
-            start_ts = now - (days * 86400)
+            start_ts = now - _PERIOD_SECONDS.get(period, _PERIOD_SECONDS["30d"])
 
             # Get games for current period
             games = self.get_games(start_date=start_ts, end_date=now)
@@ -987,8 +1175,7 @@ class AnalyticsStorage:
             now = int(time.time())
 
             # Calculate period boundaries
-            days = PERIOD_DAYS_MAP.get(period, 30)
-            start_ts = now - (days * 86400)
+            start_ts = now - _PERIOD_SECONDS.get(period, _PERIOD_SECONDS["30d"])
 
             # Get games for current period
             games = self.get_games(start_date=start_ts, end_date=now)
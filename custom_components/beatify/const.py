@@ -1,5 +1,7 @@
 """Constants for Beatify."""
 
+import re
+
 DOMAIN = "beatify"
 
 # Companion auth-bypass opt-in (#1357). The HA Android Companion bypass in
@@ -234,6 +236,14 @@ URI_PATTERN_YOUTUBE_MUSIC = r"^https://music\.youtube\.com/watch\?v=[a-zA-Z0-9_-
 URI_PATTERN_TIDAL = r"^tidal://track/\d+$"
 URI_PATTERN_DEEZER = r"^deezer://track/\d+$"
 
+# Compiled once at import: playlist validation and discovery match every URI of
+# every song against these, so call .match() on them rather than re.match().
+URI_RE_SPOTIFY = re.compile(URI_PATTERN_SPOTIFY)
+URI_RE_APPLE_MUSIC = re.compile(URI_PATTERN_APPLE_MUSIC)
+URI_RE_YOUTUBE_MUSIC = re.compile(URI_PATTERN_YOUTUBE_MUSIC)
+URI_RE_TIDAL = re.compile(URI_PATTERN_TIDAL)
+URI_RE_DEEZER = re.compile(URI_PATTERN_DEEZER)
+
 # Provider identifiers (Story 17.1)
 PROVIDER_SPOTIFY = "spotify"
 PROVIDER_APPLE_MUSIC = "apple_music"  # Preserved for future use
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import random
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -29,12 +30,17 @@ STATUS_NEAR_MISS_ACCEPTED = "near_miss_accepted"
 _LOGGER = logging.getLogger(__name__)
 
 
+def _guess_time(guess: dict[str, Any]) -> float:
+    """Sort key for ``MovieChallenge.correct_guesses`` (fastest first)."""
+    return guess["time"]
+
+
 # ------------------------------------------------------------------
 # Data classes
 # ------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtistChallenge:
     """Artist challenge state for bonus points feature (Epic 20)."""
 
@@ -42,6 +48,15 @@ class ArtistChallenge:
     options: list[str]  # Shuffled: correct + decoys
     winner: str | None = None
     winner_time: float | None = None
+    # Case-folded answer, computed once so each guess folds only its own side.
+    _answer_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._answer_key = self.correct_artist.casefold()
+
+    def is_correct(self, guess: str) -> bool:
+        """Return True if ``guess`` names the correct artist (case-insensitive)."""
+        return guess.strip().casefold() == self._answer_key
 
     def to_dict(self, include_answer: bool = False) -> dict[str, Any]:
         """
@@ -74,7 +89,7 @@ class ArtistChallenge:
         return CHALLENGE_BONUS_POINTS if self.winner == player_name else 0
 
 
-@dataclass
+@dataclass(slots=True)
 class MovieChallenge:
     """Movie quiz challenge state for bonus points feature (Issue #28)."""
 
@@ -84,6 +99,15 @@ class MovieChallenge:
         default_factory=list
     )  # [{name, time}]
     wrong_guesses: list[dict[str, Any]] = field(default_factory=list)  # [{name, guess}]
+    # Case-folded answer, computed once so each guess folds only its own side.
+    _answer_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._answer_key = self.correct_movie.casefold()
+
+    def is_correct(self, guess: str) -> bool:
+        """Return True if ``guess`` names the correct movie (case-insensitive)."""
+        return guess.strip().casefold() == self._answer_key
 
     def to_dict(self, include_answer: bool = False) -> dict[str, Any]:
         """
@@ -204,11 +228,8 @@ def build_movie_options(song: dict[str, Any]) -> list[str] | None:
         return None
 
     # Filter valid choices and deduplicate while preserving order
-    valid_choices = list(
-        dict.fromkeys(
-            c.strip() for c in movie_choices if isinstance(c, str) and c.strip()
-        )
-    )
+    stripped = (c.strip() for c in movie_choices if isinstance(c, str))
+    valid_choices = list(dict.fromkeys(c for c in stripped if c))
 
     # Ensure correct movie is included
     if movie not in valid_choices:
@@ -263,9 +284,10 @@ def build_artist_options(song: dict[str, Any]) -> list[str] | None:
         if not isinstance(a, str):
             continue
         stripped = a.strip()
-        if not stripped or stripped.lower() in seen:
+        key = stripped.lower()
+        if not stripped or key in seen:
             continue
-        seen.add(stripped.lower())
+        seen.add(key)
         valid_alts.append(stripped)
 
     if not valid_alts:
@@ -488,8 +510,7 @@ class ChallengeManager:
         if not self.artist_challenge:
             raise ValueError("No artist challenge active")
 
-        # Case-insensitive comparison
-        correct = artist.strip().lower() == self.artist_challenge.correct_artist.lower()
+        correct = self.artist_challenge.is_correct(artist)
 
         result: dict[str, Any] = {
             "correct": correct,
@@ -562,8 +583,7 @@ class ChallengeManager:
         if round_start_time is not None:
             elapsed = guess_time - round_start_time
 
-        # Case-insensitive comparison
-        correct = movie.strip().lower() == self.movie_challenge.correct_movie.lower()
+        correct = self.movie_challenge.is_correct(movie)
 
         result: dict[str, Any] = {
             "correct": correct,
@@ -573,17 +593,12 @@ class ChallengeManager:
         }
 
         if correct:
-            self.movie_challenge.correct_guesses.append(
-                {"name": player_name, "time": elapsed}
-            )
-            # Sort by time (fastest first) - ensures ranking is consistent
-            self.movie_challenge.correct_guesses.sort(key=lambda g: g["time"])
-            # Determine rank (0-indexed position)
-            rank = next(
-                i
-                for i, g in enumerate(self.movie_challenge.correct_guesses)
-                if g["name"] == player_name
-            )
+            # Keep correct_guesses sorted fastest-first: the insertion point is
+            # the rank (0-indexed), and bisect_right places an exact tie after
+            # the earlier submitter, as the previous append-then-stable-sort did.
+            guesses = self.movie_challenge.correct_guesses
+            rank = bisect_right(guesses, elapsed, key=_guess_time)
+            guesses.insert(rank, {"name": player_name, "time": elapsed})
             # Winner-takes-all: only the fastest correct guess (rank 0) pays.
             bonus = CHALLENGE_BONUS_POINTS if rank == 0 else 0
             result["rank"] = rank + 1  # 1-indexed for display
@@ -6,30 +6,60 @@ Read-only tracking — does not modify scoring or game mechanics.
 
 from __future__ import annotations
 
+import heapq
 import time
 from dataclasses import dataclass, field
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 # Priority weights for ranking highlights
-_PRIORITY: dict[str, int] = {
-    "exact_match": 3,
-    "streak": 4,
-    "bet_win": 3,
-    "heartbreaker": 5,
-    "speed_record": 2,
-    "comeback": 4,
-    "photo_finish": 5,
-}
-
-_EMOJI: dict[str, str] = {
-    "exact_match": "🎯",
-    "streak": "🔥",
-    "bet_win": "🎰",
-    "heartbreaker": "💔",
-    "speed_record": "⚡",
-    "comeback": "🚀",
-    "photo_finish": "📸",
-}
+_PRIORITY: Mapping[str, int] = MappingProxyType(
+    {
+        "exact_match": 3,
+        "streak": 4,
+        "bet_win": 3,
+        "heartbreaker": 5,
+        "speed_record": 2,
+        "comeback": 4,
+        "photo_finish": 5,
+    }
+)
+
+_EMOJI: Mapping[str, str] = MappingProxyType(
+    {
+        "exact_match": "🎯",
+        "streak": "🔥",
+        "bet_win": "🎰",
+        "heartbreaker": "💔",
+        "speed_record": "⚡",
+        "comeback": "🚀",
+        "photo_finish": "📸",
+    }
+)
+
+# Resolved once at import for the per-guess record_* paths.
+_EMOJI_EXACT_MATCH = _EMOJI["exact_match"]
+_EMOJI_STREAK = _EMOJI["streak"]
+_EMOJI_BET_WIN = _EMOJI["bet_win"]
+_EMOJI_HEARTBREAKER = _EMOJI["heartbreaker"]
+_EMOJI_SPEED_RECORD = _EMOJI["speed_record"]
+_EMOJI_COMEBACK = _EMOJI["comeback"]
+_EMOJI_PHOTO_FINISH = _EMOJI["photo_finish"]
+
+# Repetitive low-priority types: only the best instance makes the reel.
+_DEDUPE_TYPES = frozenset({"speed_record", "heartbreaker"})
+
+_SORT_KEY = attrgetter("_sort_key")
+
+
+def _stamp(timestamp: float | None) -> float:
+    """Use the caller's pre-sampled clock reading, or sample one now."""
+    return time.time() if timestamp is None else timestamp
 
 
 @dataclass
@@ -44,6 +74,18 @@ class GameHighlight:
     emoji: str = ""
     score_impact: int = 0
     timestamp: float = field(default_factory=time.time)
+    # Ranking key, derived once at construction so ranking does no lookups.
+    _sort_key: tuple[int, float, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the ranking key (lower ranks first)."""
+        time_val = 0.0
+        if self.type == "speed_record":
+            try:
+                time_val = float(self.description_params.get("time", 999))
+            except (ValueError, TypeError):
+                time_val = 999.0
+        self._sort_key = (-_PRIORITY.get(self.type, 1), time_val, self.round)
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dictionary."""
@@ -59,7 +101,11 @@ class GameHighlight:
 
 
 class HighlightsTracker:
-    """Collects and ranks game highlights."""
+    """Collects and ranks game highlights.
+
+    The ``record_*`` helpers take an optional ``timestamp`` so a caller that
+    records a burst of highlights can sample the clock once for all of them.
+    """
 
     def __init__(self) -> None:
         self._highlights: list[GameHighlight] = []
@@ -69,7 +115,13 @@ class HighlightsTracker:
         self._highlights.append(highlight)
 
     def record_exact_match(
-        self, player_name: str, song_title: str, year: int, round_num: int
+        self,
+        player_name: str,
+        song_title: str,
+        year: int,
+        round_num: int,
+        *,
+        timestamp: float | None = None,
     ) -> None:
         """Record an exact year match."""
         self.record_event(
@@ -81,15 +133,21 @@ class HighlightsTracker:
                 description_params={
                     "player": player_name,
                     "song": song_title,
-                    "year": str(year),
+                    "year": year,
                 },
-                emoji=_EMOJI["exact_match"],
+                emoji=_EMOJI_EXACT_MATCH,
                 score_impact=10,
+                timestamp=_stamp(timestamp),
             )
         )
 
     def record_streak(
-        self, player_name: str, streak_count: int, round_num: int
+        self,
+        player_name: str,
+        streak_count: int,
+        round_num: int,
+        *,
+        timestamp: float | None = None,
     ) -> None:
         """Record a streak milestone (3, 5, 7+)."""
         self.record_event(
@@ -100,15 +158,21 @@ class HighlightsTracker:
                 description="highlight_streak",
                 description_params={
                     "player": player_name,
-                    "count": str(streak_count),
+                    "count": streak_count,
                 },
-                emoji=_EMOJI["streak"],
+                emoji=_EMOJI_STREAK,
                 score_impact=0,
+                timestamp=_stamp(timestamp),
             )
         )
 
     def record_bet_win(
-        self, player_name: str, points_gained: int, round_num: int
+        self,
+        player_name: str,
+        points_gained: int,
+        round_num: int,
+        *,
+        timestamp: float | None = None,
     ) -> None:
         """Record a successful bet with significant payoff."""
         self.record_event(
@@ -119,15 +183,22 @@ class HighlightsTracker:
                 description="highlight_bet_win",
                 description_params={
                     "player": player_name,
-                    "points": str(points_gained),
+                    "points": points_gained,
                 },
-                emoji=_EMOJI["bet_win"],
+                emoji=_EMOJI_BET_WIN,
                 score_impact=points_gained,
+                timestamp=_stamp(timestamp),
             )
         )
 
     def record_heartbreaker(
-        self, player_name: str, song_title: str, years_off: int, round_num: int
+        self,
+        player_name: str,
+        song_title: str,
+        years_off: int,
+        round_num: int,
+        *,
+        timestamp: float | None = None,
     ) -> None:
         """Record a near-miss (off by 1 year)."""
         self.record_event(
@@ -139,15 +210,21 @@ class HighlightsTracker:
                 description_params={
                     "player": player_name,
                     "song": song_title,
-                    "years_off": str(years_off),
+                    "years_off": years_off,
                 },
-                emoji=_EMOJI["heartbreaker"],
+                emoji=_EMOJI_HEARTBREAKER,
                 score_impact=0,
+                timestamp=_stamp(timestamp),
             )
         )
 
     def record_speed_record(
-        self, player_name: str, time_seconds: float, round_num: int
+        self,
+        player_name: str,
+        time_seconds: float,
+        round_num: int,
+        *,
+        timestamp: float | None = None,
     ) -> None:
         """Record the fastest submission in a round."""
         self.record_event(
@@ -158,15 +235,22 @@ class HighlightsTracker:
                 description="highlight_speed_record",
                 description_params={
                     "player": player_name,
+                    # Kept as text so 4.0 still renders as "4.0" client-side.
                     "time": str(round(time_seconds, 1)),
                 },
-                emoji=_EMOJI["speed_record"],
+                emoji=_EMOJI_SPEED_RECORD,
                 score_impact=0,
+                timestamp=_stamp(timestamp),
             )
         )
 
     def record_comeback(
-        self, player_name: str, positions_gained: int, round_num: int
+        self,
+        player_name: str,
+        positions_gained: int,
+        round_num: int,
+        *,
+        timestamp: float | None = None,
     ) -> None:
         """Record a significant rank improvement."""
         self.record_event(
@@ -177,14 +261,21 @@ class HighlightsTracker:
                 description="highlight_comeback",
                 description_params={
                     "player": player_name,
-                    "positions": str(positions_gained),
+                    "positions": positions_gained,
                 },
-                emoji=_EMOJI["comeback"],
+                emoji=_EMOJI_COMEBACK,
                 score_impact=0,
+                timestamp=_stamp(timestamp),
             )
         )
 
-    def record_photo_finish(self, player_names: list[str], round_num: int) -> None:
+    def record_photo_finish(
+        self,
+        player_names: list[str],
+        round_num: int,
+        *,
+        timestamp: float | None = None,
+    ) -> None:
         """Record tied scores between players."""
         self.record_event(
             GameHighlight(
@@ -193,11 +284,12 @@ class HighlightsTracker:
                 player=player_names[0] if player_names else "",
                 description="highlight_photo_finish",
                 description_params={
-                    "round": str(round_num),
+                    "round": round_num,
                     "players": ", ".join(player_names),
                 },
-                emoji=_EMOJI["photo_finish"],
+                emoji=_EMOJI_PHOTO_FINISH,
                 score_impact=0,
+                timestamp=_stamp(timestamp),
             )
         )
 
@@ -208,30 +300,20 @@ class HighlightsTracker:
         deduplicated: only the single best instance per type is kept so that
         one fast player in a 7-round game does not fill every slot.
         """
-        _DEDUPE_TYPES = {"speed_record", "heartbreaker"}
-        seen_dedupe: set[str] = set()
-        deduped: list[GameHighlight] = []
-
-        def sort_key(h: GameHighlight) -> tuple:
-            priority = -_PRIORITY.get(h.type, 1)
-            if h.type == "speed_record":
-                try:
-                    time_val = float(h.description_params.get("time", 999))
-                except (ValueError, TypeError):
-                    time_val = 999.0
-                return (priority, time_val, h.round)
-            return (priority, 0.0, h.round)
-
-        sorted_highlights = sorted(self._highlights, key=sort_key)
-
-        for h in sorted_highlights:
+        # Best instance per dedupe type first (strict < keeps the earliest
+        # on ties), then a partial sort: the reel only needs ``limit`` entries.
+        best: dict[str, GameHighlight] = {}
+        for h in self._highlights:
             if h.type in _DEDUPE_TYPES:
-                if h.type in seen_dedupe:
-                    continue
-                seen_dedupe.add(h.type)
-            deduped.append(h)
-
-        return deduped[:limit]
+                kept = best.get(h.type)
+                if kept is None or h._sort_key < kept._sort_key:
+                    best[h.type] = h
+        candidates = [
+            h
+            for h in self._highlights
+            if h.type not in _DEDUPE_TYPES or best[h.type] is h
+        ]
+        return heapq.nsmallest(limit, candidates, key=_SORT_KEY)
 
     def to_dict(self) -> list[dict]:
         """Convert top highlights to JSON-serializable list for get_state()."""
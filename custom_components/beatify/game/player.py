@@ -13,9 +13,14 @@ if TYPE_CHECKING:
     from aiohttp import web
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerSession:
-    """Represents a connected player."""
+    """Represents a connected player.
+
+    Slotted: the scoring paths read these fields for every player on every
+    guess and round, and an undeclared attribute write fails loudly instead
+    of silently growing a ``__dict__``.
+    """
 
     name: str
     ws: web.WebSocketResponse
@@ -302,11 +307,17 @@ class PlayerSession:
     @property
     def avg_submission_time(self) -> float | None:
         """Average submission time in seconds (Story 15.2)."""
-        if len(self.submission_times) < MIN_SUBMISSIONS_FOR_SPEED:
+        times = self.submission_times
+        count = len(times)
+        if count < MIN_SUBMISSIONS_FOR_SPEED:
             return None
-        return sum(self.submission_times) / len(self.submission_times)
+        return sum(times) / count
 
     @property
     def final_three_score(self) -> int:
         """Sum of last 3 round scores (Story 15.2)."""
-        return sum(self.round_scores[-3:]) if len(self.round_scores) >= 3 else 0
+        scores = self.round_scores
+        if len(scores) < 3:
+            return 0
+        # Indexed adds: no temporary slice list per read.
+        return scores[-1] + scores[-2] + scores[-3]
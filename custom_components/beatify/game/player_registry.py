@@ -312,12 +312,26 @@ class PlayerRegistry:
         for the whole room — #928. Eliminated players (#827) never submit, so
         they are excluded from the all-submitted (early reveal) check.
         """
-        active_players = [
-            p for p in self.players.values() if p.is_active and not p.eliminated
-        ]
-        if not active_players:
-            return False
-        return all(p.submitted for p in active_players)
+        return self.submission_status()[1]
+
+    def submission_status(self) -> tuple[int, bool]:
+        """Return ``(submitted_count, all_submitted)`` from a single pass.
+
+        ``submitted_count`` counts every submitted player; ``all_submitted``
+        applies the ``all_submitted`` rules (active, non-eliminated players
+        only, and False when there are none).
+        """
+        submitted_count = 0
+        any_active = False
+        all_active_submitted = True
+        for p in self.players.values():
+            if p.submitted:
+                submitted_count += 1
+            if p.is_active and not p.eliminated:
+                any_active = True
+                if not p.submitted:
+                    all_active_submitted = False
+        return submitted_count, any_active and all_active_submitted
 
     def get_average_score(self) -> int:
         """Calculate average score for late joiners.
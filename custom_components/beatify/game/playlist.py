@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import logging
+import os
 import random
 import re
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 from custom_components.beatify.const import (
     DOMAIN,
     PLAYLIST_DIR,
@@ -21,11 +24,11 @@ from custom_components.beatify.const import (
     PROVIDER_SPOTIFY,
     PROVIDER_TIDAL,
     PROVIDER_YOUTUBE_MUSIC,
-    URI_PATTERN_APPLE_MUSIC,
-    URI_PATTERN_DEEZER,
-    URI_PATTERN_SPOTIFY,
-    URI_PATTERN_TIDAL,
-    URI_PATTERN_YOUTUBE_MUSIC,
+    URI_RE_APPLE_MUSIC,
+    URI_RE_DEEZER,
+    URI_RE_SPOTIFY,
+    URI_RE_TIDAL,
+    URI_RE_YOUTUBE_MUSIC,
 )
 
 if TYPE_CHECKING:
@@ -34,16 +37,16 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 _URI_FIELDS = [
-    ("uri", URI_PATTERN_SPOTIFY, "spotify:track:{22-char-id}"),
-    ("uri_spotify", URI_PATTERN_SPOTIFY, "spotify:track:{22-char-id}"),
-    ("uri_apple_music", URI_PATTERN_APPLE_MUSIC, "applemusic://track/id"),
+    ("uri", URI_RE_SPOTIFY, "spotify:track:{22-char-id}"),
+    ("uri_spotify", URI_RE_SPOTIFY, "spotify:track:{22-char-id}"),
+    ("uri_apple_music", URI_RE_APPLE_MUSIC, "applemusic://track/id"),
     (
         "uri_youtube_music",
-        URI_PATTERN_YOUTUBE_MUSIC,
+        URI_RE_YOUTUBE_MUSIC,
         "https://music.youtube.com/watch?v=...",
     ),
-    ("uri_tidal", URI_PATTERN_TIDAL, "tidal://track/{id}"),
-    ("uri_deezer", URI_PATTERN_DEEZER, "deezer://track/{id}"),
+    ("uri_tidal", URI_RE_TIDAL, "tidal://track/{id}"),
+    ("uri_deezer", URI_RE_DEEZER, "deezer://track/{id}"),
 ]
 
 
@@ -101,19 +104,21 @@ class PlaylistManager:
         self._provider = provider
         self._storefront = storefront
         total_count = len(songs)
-        filtered_songs, _ = filter_songs_for_provider(songs, provider, storefront)
         self._played_uris: set[str] = set()
 
         # Group songs into per-playlist buckets, deduplicating by URI.
-        # Songs explicitly unavailable in the user's storefront (per
-        # `uri_apple_music_by_region`) get filtered out here — they never
-        # enter the playable pool, so the runtime never even tries to play
-        # them.
+        # Songs without a URI for the provider, or explicitly unavailable in
+        # the user's storefront (per `uri_apple_music_by_region`), get
+        # filtered out here — they never enter the playable pool, so the
+        # runtime never even tries to play them. This is the only URI
+        # resolution pass; the songs are not pre-filtered separately.
         seen_uris: set[str] = set()
         buckets: dict[str, list[dict[str, Any]]] = {}
         regional_skipped = 0
-        for song in filtered_songs:
-            uri = get_song_uri(song, provider, storefront)
+        no_uri_skipped = 0
+        resolve = song_uri_resolver(provider, storefront)
+        for song in songs:
+            uri = resolve(song)
             if not uri:
                 # Could be no URI for provider OR explicitly null in storefront.
                 if (
@@ -123,6 +128,8 @@ class PlaylistManager:
                     and song["uri_apple_music_by_region"][storefront] is None
                 ):
                     regional_skipped += 1
+                else:
+                    no_uri_skipped += 1
                 continue
             if uri in seen_uris:
                 continue
@@ -140,6 +147,13 @@ class PlaylistManager:
         self._songs = [s for bucket in buckets.values() for s in bucket]
         self._multi_playlist = len(buckets) > 1
 
+        # Unplayed songs per bucket plus each pooled URI's (bucket, index) slot,
+        # so a pick is one random.choice and mark_played a swap-pop — neither
+        # rescans the pool, which a long game on a big playlist did every round.
+        self._unplayed: dict[str, list[dict[str, Any]]] = {}
+        self._slots: dict[str, tuple[str, int]] = {}
+        self._fill_unplayed()
+
         deduped = sum(len(v) for v in buckets.values())
         _LOGGER.info(
             "PlaylistManager: %d/%d songs across %d playlist(s) for %s"
@@ -150,6 +164,7 @@ class PlaylistManager:
             len(buckets),
             provider,
         )
+        _warn_songs_without_uri(no_uri_skipped, provider)
         if regional_skipped:
             _LOGGER.info(
                 "Filtered %d song(s) confirmed unavailable in storefront '%s' "
@@ -164,6 +179,8 @@ class PlaylistManager:
         self._song_order = song_order
         self._difficulty_lookup = difficulty_lookup
         self._rampup_order: list[dict[str, Any]] | None = None
+        # Everything before this index in the arc has been played.
+        self._rampup_cursor = 0
         if song_order == SONG_ORDER_RAMPUP and difficulty_lookup is not None:
             self._rampup_order = self._build_rampup_order()
             if self._rampup_order is None:
@@ -235,22 +252,16 @@ class PlaylistManager:
             return self._pick_from_rampup_order()
 
         if not self._multi_playlist:
-            return self._pick_from_pool(self._songs)
+            # Zero or one bucket: its unplayed list is the whole pool.
+            return self._pick_from_pool(next(iter(self._unplayed.values()), []))
 
         # Balanced: pick a random non-exhausted playlist, then a song.
-        # #1710: filter against the precomputed URI cached in __init__ instead
-        # of re-resolving get_song_uri() for every song every round.
-        active_buckets = {
-            k: [s for s in v if s["_precomputed_uri"] not in self._played_uris]
-            for k, v in self._buckets.items()
-        }
-        active_buckets = {k: v for k, v in active_buckets.items() if v}
-
-        if not active_buckets:
+        active_keys = [k for k, pool in self._unplayed.items() if pool]
+        if not active_keys:
             return None
 
-        chosen_key = random.choice(list(active_buckets.keys()))  # noqa: S311
-        song = random.choice(active_buckets[chosen_key])  # noqa: S311
+        chosen_key = random.choice(active_keys)  # noqa: S311
+        song = random.choice(self._unplayed[chosen_key])  # noqa: S311
         song_copy = song.copy()
         song_copy["_resolved_uri"] = song["_precomputed_uri"]
         return song_copy
@@ -263,25 +274,39 @@ class PlaylistManager:
         songs (no URI / playback failure → mark_played) simply advance the arc.
         """
         assert self._rampup_order is not None  # noqa: S101 — guarded by caller
-        for song in self._rampup_order:
+        order = self._rampup_order
+        # Played songs only accumulate until reset(), so the scan resumes
+        # where the last one stopped instead of re-walking the arc's head.
+        cursor = self._rampup_cursor
+        while cursor < len(order):
+            song = order[cursor]
             if song["_precomputed_uri"] not in self._played_uris:
+                self._rampup_cursor = cursor
                 song_copy = song.copy()
                 song_copy["_resolved_uri"] = song["_precomputed_uri"]
                 return song_copy
+            cursor += 1
+        self._rampup_cursor = cursor
         return None
 
     def _pick_from_pool(self, pool: list[dict[str, Any]]) -> dict[str, Any] | None:
-        """Pick a random unplayed song from a flat pool."""
-        # #1710: pool songs carry a precomputed URI (set in __init__); use it
-        # instead of re-resolving get_song_uri() for the whole pool each round.
-        available = [s for s in pool if s["_precomputed_uri"] not in self._played_uris]
-        if not available:
+        """Pick a random song from an unplayed pool."""
+        if not pool:
             return None
-        song = random.choice(available)  # noqa: S311
+        song = random.choice(pool)  # noqa: S311
         song_copy = song.copy()
         song_copy["_resolved_uri"] = song["_precomputed_uri"]
         return song_copy
 
+    def _fill_unplayed(self) -> None:
+        """(Re)build the unplayed pools and URI slots from the buckets."""
+        self._unplayed = {key: list(bucket) for key, bucket in self._buckets.items()}
+        self._slots = {
+            song["_precomputed_uri"]: (key, index)
+            for key, pool in self._unplayed.items()
+            for index, song in enumerate(pool)
+        }
+
     def mark_played(self, uri: str) -> None:
         """Mark a song as played.
 
@@ -290,10 +315,23 @@ class PlaylistManager:
 
         """
         self._played_uris.add(uri)
+        slot = self._slots.pop(uri, None)
+        if slot is None:
+            # Unknown or already-played URI: nothing to take out of a pool.
+            return
+        key, index = slot
+        pool = self._unplayed[key]
+        last = pool.pop()
+        if index < len(pool):
+            # Swap-pop: move the tail song into the vacated slot.
+            pool[index] = last
+            self._slots[last["_precomputed_uri"]] = (key, index)
 
     def reset(self) -> None:
         """Reset played tracking for new game."""
         self._played_uris.clear()
+        self._fill_unplayed()
+        self._rampup_cursor = 0
 
     def get_remaining_count(self) -> int:
         """Get count of unplayed songs.
@@ -364,29 +402,64 @@ async def async_ensure_playlist_directory(hass: HomeAssistant) -> Path:
 
 
 def _get_playlist_version(path: Path) -> str:
-    """Get version from playlist file. Returns '0.0' if no version field."""
+    """Get version from playlist file. Returns '0.0' if no version field.
+
+    Parses the whole file, so a damaged copy (e.g. one truncated by an
+    interrupted write) reads as '0.0' and is replaced by the bundled file.
+    """
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = orjson.loads(path.read_bytes())
         return data.get("version", "0.0")
     except (OSError, ValueError):
         return "0.0"
 
 
-def _compare_versions(v1: str, v2: str) -> int:
-    """Compare version strings. Returns: -1 if v1<v2, 0 if equal, 1 if v1>v2."""
+# Playlist files put their top-level metadata (name, version, tags, ...) ahead
+# of the songs array, so the version string sits in the first few hundred
+# bytes. Only the text before "songs" is searched, so a key inside a song can
+# never match, and only plain dotted versions are taken from the head —
+# anything else falls back to the full parse.
+_VERSION_HEAD_BYTES = 1024
+_VERSION_HEAD_RE = re.compile(rb'"version"\s*:\s*"([0-9.]{1,32})"')
 
-    def parse(v: str) -> tuple[int, ...]:
-        return tuple(int(x) for x in v.split("."))
 
+def _get_bundled_playlist_version(path: Path) -> str:
+    """Get version from a bundled playlist, reading just the file head.
+
+    The bundled playlists run to hundreds of KB each and are checked on every
+    startup. They ship with the integration, so their head is trusted; the
+    installed copies are not and go through ``_get_playlist_version``.
+    """
     try:
-        p1, p2 = parse(v1), parse(v2)
-        if p1 < p2:
-            return -1
-        if p1 > p2:
-            return 1
-        return 0
+        with path.open("rb") as fh:
+            head = fh.read(_VERSION_HEAD_BYTES)
+    except OSError:
+        return "0.0"
+    match = _VERSION_HEAD_RE.search(head.split(b'"songs"', 1)[0])
+    if match:
+        return match.group(1).decode("ascii")
+    return _get_playlist_version(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_version(v: str) -> tuple[int, ...] | None:
+    """Parse a dotted version into an int tuple, or None if it is malformed.
+
+    Cached: the bundled corpus only uses a handful of distinct versions, each
+    compared against the installed copy on every startup.
+    """
+    try:
+        return tuple(int(x) for x in v.split("."))
     except ValueError:
+        return None
+
+
+def _compare_versions(v1: str, v2: str) -> int:
+    """Compare version strings. Returns: -1 if v1<v2, 0 if equal, 1 if v1>v2."""
+    p1, p2 = _parse_version(v1), _parse_version(v2)
+    if p1 is None or p2 is None:
         return 0
+    return (p1 > p2) - (p1 < p2)
 
 
 def _index_bundled_by_name(
@@ -478,58 +551,83 @@ async def _copy_bundled_playlists(dest_dir: Path) -> None:
         """Copy file contents, creating parent dirs (runs in executor).
 
         #1402 B3: folds the previously-on-event-loop ``mkdir`` in here.
+        Written to a temp file and renamed over ``dst`` (as in
+        ``AnalyticsStorage._save``), so a crash or full disk mid-copy leaves
+        the previous copy in place rather than a truncated playlist.
         """
         dst.parent.mkdir(parents=True, exist_ok=True)
-        content = src.read_text(encoding="utf-8")
-        dst.write_text(content, encoding="utf-8")
+        content = src.read_bytes()
+        temp_path = dst.with_name(f"{dst.name}.tmp")
+        try:
+            with open(temp_path, "wb") as temp_file:
+                temp_file.write(content)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, dst)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
 
-    def _get_versions(src: Path, dst: Path) -> tuple[str, str, bool]:
-        """Get versions from both files + whether dst exists (runs in executor).
+    def _sync_process(src: Path, dst: Path) -> tuple[str, str, str]:
+        """Compare versions and copy if needed in one executor job.
 
-        #1402 B3: returns ``dst_exists`` so the caller reuses this single stat
-        instead of re-running a blocking ``dst.exists()`` on the event loop.
+        Returns ``(action, bundled_ver, existing_ver)`` where ``action`` is
+        ``"copied"``, ``"updated"`` or ``"current"``. #1402 B3: ``dst_exists``
+        comes from the same stat used for the version read.
         """
-        bundled_ver = _get_playlist_version(src)
+        bundled_ver = _get_bundled_playlist_version(src)
         dst_exists = dst.exists()
         existing_ver = _get_playlist_version(dst) if dst_exists else "0.0"
-        return bundled_ver, existing_ver, dst_exists
+        if not dst_exists:
+            _copy_file(src, dst)
+            return "copied", bundled_ver, existing_ver
+        if _compare_versions(bundled_ver, existing_ver) > 0:
+            _copy_file(src, dst)
+            return "updated", bundled_ver, existing_ver
+        return "current", bundled_ver, existing_ver
 
     # Offload blocking glob to executor to avoid scandir in event loop (#516)
     playlist_files = await loop.run_in_executor(
         None, lambda: list(bundled_dir.glob("**/*.json"))
     )
-    for playlist_file in playlist_files:
-        # Preserve relative path (e.g. community/greatest-metal-songs.json)
-        rel = playlist_file.relative_to(bundled_dir)
-        dest_file = dest_dir / rel
-        try:
-            # Get versions (+ existence, reused below — _copy_file makes the dir)
-            bundled_ver, existing_ver, dest_exists = await loop.run_in_executor(
-                None, _get_versions, playlist_file, dest_file
+    # One executor job per file, all in flight at once — the files are
+    # independent, so there is no reason to await them one by one.
+    # Relative paths are preserved (e.g. community/greatest-metal-songs.json).
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                None,
+                _sync_process,
+                playlist_file,
+                dest_dir / playlist_file.relative_to(bundled_dir),
             )
-
-            if not dest_exists:
-                # New playlist - copy it
-                await loop.run_in_executor(None, _copy_file, playlist_file, dest_file)
-                _LOGGER.info(
-                    "Copied bundled playlist %s (v%s)", playlist_file.name, bundled_ver
-                )
-            elif _compare_versions(bundled_ver, existing_ver) > 0:
-                # Bundled version is newer - update
-                await loop.run_in_executor(None, _copy_file, playlist_file, dest_file)
-                _LOGGER.info(
-                    "Updated playlist %s: v%s -> v%s",
-                    playlist_file.name,
-                    existing_ver,
-                    bundled_ver,
-                )
-            else:
-                _LOGGER.debug(
-                    "Playlist %s is up to date (v%s)", playlist_file.name, existing_ver
-                )
-        except OSError as err:
+            for playlist_file in playlist_files
+        ),
+        return_exceptions=True,
+    )
+    for playlist_file, result in zip(playlist_files, results, strict=True):
+        if isinstance(result, OSError):
             _LOGGER.warning(
-                "Failed to process playlist %s: %s", playlist_file.name, err
+                "Failed to process playlist %s: %s", playlist_file.name, result
+            )
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        action, bundled_ver, existing_ver = result
+        if action == "copied":
+            _LOGGER.info(
+                "Copied bundled playlist %s (v%s)", playlist_file.name, bundled_ver
+            )
+        elif action == "updated":
+            _LOGGER.info(
+                "Updated playlist %s: v%s -> v%s",
+                playlist_file.name,
+                existing_ver,
+                bundled_ver,
+            )
+        else:
+            _LOGGER.debug(
+                "Playlist %s is up to date (v%s)", playlist_file.name, existing_ver
             )
 
     # #1864: every current playlist is on disk now, so anything left at a former
@@ -585,7 +683,11 @@ def validate_playlist(
     if len(songs) == 0:
         errors.append("Playlist has no songs")
 
-    # Validate each song
+    # Validate each song. Bound matchers and a per-song ``get`` keep the
+    # attribute lookups out of the ~10 field checks each song goes through.
+    uri_fields = [
+        (field, pattern.match, expected) for field, pattern, expected in _URI_FIELDS
+    ]
     for i, song in enumerate(songs):
         if not isinstance(song, dict):
             errors.append(f"Song {i + 1}: not a valid object")
@@ -605,16 +707,18 @@ def validate_playlist(
         # flat ``errors`` list below to keep the legacy string output identical.
         song_reasons: list[str] = []
 
+        get = song.get
+
         # #697: title and artist are required for gameplay (challenge + reveal).
-        title = song.get("title")
+        title = get("title")
         if not isinstance(title, str) or not title.strip():
             song_reasons.append("missing or empty 'title'")
-        artist = song.get("artist")
+        artist = get("artist")
         if not isinstance(artist, str) or not artist.strip():
             song_reasons.append("missing or empty 'artist'")
 
         # Check year
-        year = song.get("year")
+        year = get("year")
         if not isinstance(year, int):
             song_reasons.append("missing or invalid 'year' (must be integer)")
         elif not (MIN_YEAR <= year <= max_year):
@@ -622,10 +726,10 @@ def validate_playlist(
 
         # Check URIs - validate patterns and ensure at least one valid URI exists
         has_valid_uri = False
-        for field, pattern, expected in _URI_FIELDS:
-            value = song.get(field)
+        for field, match, expected in uri_fields:
+            value = get(field)
             if isinstance(value, str) and value.strip():
-                if re.match(pattern, value):
+                if match(value):
                     has_valid_uri = True
                 else:
                     song_reasons.append(f"'{field}' invalid (expected {expected})")
@@ -635,25 +739,25 @@ def validate_playlist(
             song_reasons.append("no valid URI")
 
         # Story 20.2: Validate alt_artists if present (optional field)
-        alt_artists = song.get("alt_artists")
+        alt_artists = get("alt_artists")
         if alt_artists is not None:
             if not isinstance(alt_artists, list):
                 song_reasons.append("'alt_artists' must be an array")
             else:
+                valid_alts = 0
                 for j, alt in enumerate(alt_artists):
-                    if not isinstance(alt, str) or not alt.strip():
+                    if isinstance(alt, str) and alt.strip():
+                        valid_alts += 1
+                    else:
                         song_reasons.append(
                             f"'alt_artists[{j}]' must be non-empty string"
                         )
                 # Log warning if fewer than 2 alternatives (weak challenge)
-                valid_alts = [
-                    a for a in alt_artists if isinstance(a, str) and a.strip()
-                ]
-                if len(valid_alts) < 2:
+                if valid_alts < 2:
                     _LOGGER.debug(
                         "Song %d has only %d alt_artists (2 recommended)",
                         i + 1,
-                        len(valid_alts),
+                        valid_alts,
                     )
 
         # Flush this song's reasons into the flat error list (prefixed, in the
@@ -706,6 +810,96 @@ def summarize_rejected_songs(
     return "; ".join(parts)
 
 
+def _spotify_uri(song: dict[str, Any]) -> str | None:
+    # For Spotify, prefer uri_spotify, fall back to legacy uri field
+    return song.get("uri_spotify") or song.get("uri") or None
+
+
+def _apple_music_uri(song: dict[str, Any]) -> str | None:
+    return song.get("uri_apple_music") or None
+
+
+def _youtube_music_uri(song: dict[str, Any]) -> str | None:
+    # For YouTube Music, only use uri_youtube_music
+    return song.get("uri_youtube_music") or None
+
+
+def _tidal_uri(song: dict[str, Any]) -> str | None:
+    # For Tidal, only use uri_tidal
+    return song.get("uri_tidal") or None
+
+
+def _deezer_uri(song: dict[str, Any]) -> str | None:
+    # For Deezer, only use uri_deezer
+    return song.get("uri_deezer") or None
+
+
+def _amazon_music_uri(song: dict[str, Any]) -> str | None:
+    # Amazon Music uses Alexa text search — there is no real per-track URI.
+    # We still must return a *distinct* identity per song, because the
+    # PlaylistManager uses this value both as the dedup key (__init__) and
+    # as the played-tracking key (mark_played). Returning a single constant
+    # for every song collapsed the whole playlist to one playable track and
+    # ended every Alexa game after round 1 (#1361). Derive a stable key from
+    # the song's artist+title so each track survives dedup and is tracked
+    # independently. `_resolved_uri` is only ever consumed for Alexa
+    # text-search (artist+title), never as a real media URI, so this
+    # synthetic key is purely internal.
+    artist = (song.get("artist") or "").strip().casefold()
+    title = (song.get("title") or "").strip().casefold()
+    if artist or title:
+        return f"amazon:{artist}|{title}"
+    # No metadata at all — fall back to the song's id so it stays distinct.
+    song_id = song.get("id")
+    if song_id is not None:
+        return f"amazon:id:{song_id}"
+    return None
+
+
+def _no_uri(song: dict[str, Any]) -> str | None:
+    return None
+
+
+_URI_RESOLVERS: dict[str, Callable[[dict[str, Any]], str | None]] = {
+    PROVIDER_SPOTIFY: _spotify_uri,
+    PROVIDER_APPLE_MUSIC: _apple_music_uri,
+    PROVIDER_YOUTUBE_MUSIC: _youtube_music_uri,
+    PROVIDER_TIDAL: _tidal_uri,
+    PROVIDER_DEEZER: _deezer_uri,
+    PROVIDER_AMAZON_MUSIC: _amazon_music_uri,
+}
+
+
+def song_uri_resolver(
+    provider: str,
+    storefront: str | None = None,
+) -> Callable[[dict[str, Any]], str | None]:
+    """Return a function mapping a song to its URI for ``provider``.
+
+    Same results as ``get_song_uri(song, provider, storefront)``, with the
+    provider dispatch done once up-front — loops over a whole playlist call
+    the returned function per song instead of re-walking the provider chain.
+    """
+    if provider == PROVIDER_APPLE_MUSIC and storefront:
+        # #808 follow-up: storefront-aware resolution. Beatify's playlists
+        # historically stored a single Apple Music URI per song (typically
+        # a US-storefront track ID); for users on other storefronts (DE,
+        # GB, FR, ...) some subset isn't in their regional catalog. The
+        # `uri_apple_music_by_region` map (populated by
+        # `scripts/fetch_apple_music_regions.py`) gives per-region track
+        # IDs (or explicit None for confirmed-unavailable).
+        def _regional_apple_music_uri(song: dict[str, Any]) -> str | None:
+            regional = song.get("uri_apple_music_by_region") or {}
+            if storefront in regional:
+                # Explicit per-region answer (URI string OR None).
+                return regional[storefront]
+            # No per-region data: fall back to legacy field.
+            return song.get("uri_apple_music") or None
+
+        return _regional_apple_music_uri
+    return _URI_RESOLVERS.get(provider, _no_uri)
+
+
 def get_song_uri(
     song: dict[str, Any],
     provider: str,
@@ -731,54 +925,7 @@ def get_song_uri(
         skip the song silently without ever calling MA.
 
     """
-    if provider == PROVIDER_SPOTIFY:
-        # For Spotify, prefer uri_spotify, fall back to legacy uri field
-        return song.get("uri_spotify") or song.get("uri") or None
-    if provider == PROVIDER_APPLE_MUSIC:
-        # #808 follow-up: storefront-aware resolution. Beatify's playlists
-        # historically stored a single Apple Music URI per song (typically
-        # a US-storefront track ID); for users on other storefronts (DE,
-        # GB, FR, ...) some subset isn't in their regional catalog. The
-        # `uri_apple_music_by_region` map (populated by
-        # `scripts/fetch_apple_music_regions.py`) gives per-region track
-        # IDs (or explicit None for confirmed-unavailable).
-        if storefront:
-            regional = song.get("uri_apple_music_by_region") or {}
-            if storefront in regional:
-                # Explicit per-region answer (URI string OR None).
-                return regional[storefront]
-        # No storefront, or no per-region data: fall back to legacy field.
-        return song.get("uri_apple_music") or None
-    if provider == PROVIDER_YOUTUBE_MUSIC:
-        # For YouTube Music, only use uri_youtube_music
-        return song.get("uri_youtube_music") or None
-    if provider == PROVIDER_TIDAL:
-        # For Tidal, only use uri_tidal
-        return song.get("uri_tidal") or None
-    if provider == PROVIDER_DEEZER:
-        # For Deezer, only use uri_deezer
-        return song.get("uri_deezer") or None
-    if provider == PROVIDER_AMAZON_MUSIC:
-        # Amazon Music uses Alexa text search — there is no real per-track URI.
-        # We still must return a *distinct* identity per song, because the
-        # PlaylistManager uses this value both as the dedup key (__init__) and
-        # as the played-tracking key (mark_played). Returning a single constant
-        # for every song collapsed the whole playlist to one playable track and
-        # ended every Alexa game after round 1 (#1361). Derive a stable key from
-        # the song's artist+title so each track survives dedup and is tracked
-        # independently. `_resolved_uri` is only ever consumed for Alexa
-        # text-search (artist+title), never as a real media URI, so this
-        # synthetic key is purely internal.
-        artist = (song.get("artist") or "").strip().casefold()
-        title = (song.get("title") or "").strip().casefold()
-        if artist or title:
-            return f"amazon:{artist}|{title}"
-        # No metadata at all — fall back to the song's id so it stays distinct.
-        song_id = song.get("id")
-        if song_id is not None:
-            return f"amazon:id:{song_id}"
-        return None
-    return None
+    return song_uri_resolver(provider, storefront)(song)
 
 
 def get_playback_uri(song: dict[str, Any]) -> str | None:
@@ -820,21 +967,23 @@ def filter_songs_for_provider(
         Tuple of (filtered_songs, skipped_count)
 
     """
-    filtered: list[dict[str, Any]] = []
-    skipped = 0
+    resolve = song_uri_resolver(provider, storefront)
+    filtered = [song for song in songs if resolve(song)]
+    skipped = len(songs) - len(filtered)
+    _warn_songs_without_uri(skipped, provider)
+    return (filtered, skipped)
 
-    for song in songs:
-        uri = get_song_uri(song, provider, storefront)
-        if uri:
-            filtered.append(song)
-        else:
-            year = song.get("year", "unknown")
-            _LOGGER.warning(
-                "Skipping song (year %s) - no URI for provider '%s'", year, provider
-            )
-            skipped += 1
 
-    return (filtered, skipped)
+def _warn_songs_without_uri(skipped: int, provider: str) -> None:
+    """Log one summary warning for songs dropped for lacking a provider URI.
+
+    A playlist without e.g. Tidal URIs used to log one warning per song —
+    hundreds of lines (and formatting calls) for a single game start.
+    """
+    if skipped:
+        _LOGGER.warning(
+            "Skipped %d song(s) with no URI for provider '%s'", skipped, provider
+        )
 
 
 # hass.data[DOMAIN] key holding the memoised discovery result (#1704).
@@ -847,29 +996,169 @@ _DISCOVERY_CACHE_KEY = "_playlist_discovery_cache"
 # with no explicit hook needed in those write paths (#1704).
 _DiscoverySig = tuple[tuple[str, int, int], ...]
 
+# One file's discovery result: (meta, parsed songs) — see _discover_playlist_file.
+_DiscoveredFile = tuple[dict | None, list[dict[str, Any]] | None]
+
+
+def _discover_playlist_file(
+    json_file: Path, playlist_dir: Path
+) -> tuple[dict | None, list[dict[str, Any]] | None]:
+    """Read, parse, validate and count ONE playlist file (#1704).
+
+    Returns ``(meta, songs)``. ``meta`` is ``None`` for an empty playlist that
+    discovery skips (#716); ``songs`` is ``None`` for a file that is not valid
+    JSON (its meta still lists it, with the error). Raises ``OSError`` when the
+    file cannot be read.
+    """
+    try:
+        rel = json_file.relative_to(playlist_dir)
+        source = (
+            "community"
+            if rel.parts and rel.parts[0] in ("community", "user")
+            else "bundled"
+        )
+        data = orjson.loads(json_file.read_bytes())
+        rejected_songs: list[dict[str, Any]] = []
+        is_valid, errors = validate_playlist(data, rejected_songs=rejected_songs)
+
+        # Count songs per provider (Story 17.1), validating URI patterns (#708).
+        songs = data.get("songs", [])
+
+        # One pass over the songs for all five providers instead of one each.
+        spotify_count = apple_music_count = youtube_music_count = 0
+        tidal_count = deezer_count = 0
+        for s in songs:
+            v = s.get("uri_spotify")
+            if isinstance(v, str) and URI_RE_SPOTIFY.match(v):
+                spotify_count += 1
+            else:
+                v = s.get("uri")
+                if isinstance(v, str) and URI_RE_SPOTIFY.match(v):
+                    spotify_count += 1
+            v = s.get("uri_apple_music")
+            if isinstance(v, str) and URI_RE_APPLE_MUSIC.match(v):
+                apple_music_count += 1
+            v = s.get("uri_youtube_music")
+            if isinstance(v, str) and URI_RE_YOUTUBE_MUSIC.match(v):
+                youtube_music_count += 1
+            v = s.get("uri_tidal")
+            if isinstance(v, str) and URI_RE_TIDAL.match(v):
+                tidal_count += 1
+            v = s.get("uri_deezer")
+            if isinstance(v, str) and URI_RE_DEEZER.match(v):
+                deezer_count += 1
+        # Amazon Music uses Alexa text search — every song in the playlist is
+        # playable, so the count always equals the total song count.
+        amazon_music_count = len(songs)
+
+        # #716: skip playlists with no songs entirely — they only confuse the UI.
+        if not is_valid and len(songs) == 0:
+            _LOGGER.debug("Skipping empty playlist from discovery: %s", json_file.name)
+            return None, None
+
+        # #1704: return the parsed songs too so the mixer reuses this parse
+        # instead of re-reading + re-parsing every tag file a second time.
+        return (
+            {
+                "path": str(json_file),
+                "filename": json_file.name,
+                "name": data.get("name", json_file.stem),
+                "source": source,
+                "author": data.get("author"),
+                "description": data.get("description"),
+                "language": data.get("language"),
+                "added_date": data.get("added_date"),
+                "version": data.get("version"),
+                "tags": data.get("tags", []),  # Issue #70: Tag-based filtering
+                "song_count": len(songs),
+                "spotify_count": spotify_count,
+                "apple_music_count": apple_music_count,
+                "youtube_music_count": youtube_music_count,
+                "tidal_count": tidal_count,
+                "deezer_count": deezer_count,
+                "amazon_music_count": amazon_music_count,
+                "is_valid": is_valid,
+                "errors": errors,
+                # #1576: structured per-song rejections so the playlist
+                # browser can show *which* tracks dropped and why, not just
+                # the positional "Song N: ..." strings.
+                "rejected_songs": rejected_songs,
+            },
+            songs,
+        )
+    except orjson.JSONDecodeError as e:
+        try:
+            rel = json_file.relative_to(playlist_dir)
+            source = (
+                "community"
+                if rel.parts and rel.parts[0] in ("community", "user")
+                else "bundled"
+            )
+        except ValueError:
+            source = "bundled"
+        return (
+            {
+                "path": str(json_file),
+                "filename": json_file.name,
+                "name": json_file.stem,
+                "source": source,
+                "author": None,
+                "description": None,
+                "language": None,
+                "added_date": None,
+                "version": None,
+                "tags": [],  # Issue #70
+                "song_count": 0,
+                "spotify_count": 0,
+                "apple_music_count": 0,
+                "youtube_music_count": 0,
+                "tidal_count": 0,
+                "deezer_count": 0,
+                "amazon_music_count": 0,
+                "is_valid": False,
+                "errors": [f"Invalid JSON: {e}"],
+                "rejected_songs": [],
+            },
+            None,
+        )
+
 
 def _discover_playlists_sync(
-    playlist_dir: Path, cached_sig: _DiscoverySig | None
-) -> tuple[list[dict], dict[str, list[dict[str, Any]]], _DiscoverySig] | None:
+    playlist_dir: Path,
+    cached_sig: _DiscoverySig | None,
+    cached_files: dict[tuple[str, int, int], _DiscoveredFile] | None = None,
+) -> (
+    tuple[
+        list[dict],
+        dict[str, list[dict[str, Any]]],
+        _DiscoverySig,
+        dict[tuple[str, int, int], _DiscoveredFile],
+    ]
+    | None
+):
     """Walk + read + parse + validate + count every playlist, in ONE executor job.
 
     #1704: previously only the raw file reads ran in the executor while
-    ``json.loads`` + ``validate_playlist`` (~6 regexes/song) + 5 provider-count
+    ``orjson.loads`` + ``validate_playlist`` (~6 regexes/song) + 5 provider-count
     passes ran on the event loop on every ``/api/status`` request. This does the
     whole job off-loop and returns finished dicts.
 
     Returns ``None`` when ``cached_sig`` matches the current on-disk signature
     (i.e. nothing changed → the caller reuses its cached result). Otherwise
-    returns ``(metas, songs_by_path, signature)`` where ``metas`` is the public
-    discovery payload (unchanged shape) and ``songs_by_path`` maps each playlist
-    path to its parsed song list so callers (the mixer) can reuse the parse
-    instead of re-reading the file.
+    returns ``(metas, songs_by_path, signature, files)`` where ``metas`` is the
+    public discovery payload (unchanged shape) and ``songs_by_path`` maps each
+    playlist path to its parsed song list so callers (the mixer) can reuse the
+    parse instead of re-reading the file.
+
+    ``files`` maps each file's signature entry to its parse result. Passed back
+    in as ``cached_files``, it lets a walk after a single save / delete reuse
+    every untouched file's parse and only re-read the files that changed.
     """
     if not playlist_dir.exists():
         empty_sig: _DiscoverySig = ()
         if cached_sig == empty_sig:
             return None
-        return [], {}, empty_sig
+        return [], {}, empty_sig, {}
 
     # Offload blocking glob to executor to avoid scandir in event loop (#516).
     json_files = sorted(playlist_dir.glob("**/*.json"))
@@ -889,129 +1178,30 @@ def _discover_playlists_sync(
 
     playlists: list[dict] = []
     songs_by_path: dict[str, list[dict[str, Any]]] = {}
+    files: dict[tuple[str, int, int], _DiscoveredFile] = {}
+    sig_by_path = {part[0]: part for part in signature}
     for json_file in json_files:
         try:
-            rel = json_file.relative_to(playlist_dir)
-            source = (
-                "community"
-                if rel.parts and rel.parts[0] in ("community", "user")
-                else "bundled"
-            )
-            data = json.loads(json_file.read_text(encoding="utf-8"))
-            rejected_songs: list[dict[str, Any]] = []
-            is_valid, errors = validate_playlist(data, rejected_songs=rejected_songs)
-
-            # Count songs per provider (Story 17.1), validating URI patterns (#708).
-            songs = data.get("songs", [])
-
-            def _count(field: str, pattern: str, songs: list = songs) -> int:
-                n = 0
-                for s in songs:
-                    v = s.get(field)
-                    if isinstance(v, str) and v and re.match(pattern, v):
-                        n += 1
-                return n
-
-            spotify_count = sum(
-                1
-                for s in songs
-                if (
-                    (
-                        isinstance(s.get("uri_spotify"), str)
-                        and re.match(URI_PATTERN_SPOTIFY, s["uri_spotify"])
-                    )
-                    or (
-                        isinstance(s.get("uri"), str)
-                        and re.match(URI_PATTERN_SPOTIFY, s["uri"])
-                    )
-                )
-            )
-            apple_music_count = _count("uri_apple_music", URI_PATTERN_APPLE_MUSIC)
-            youtube_music_count = _count("uri_youtube_music", URI_PATTERN_YOUTUBE_MUSIC)
-            tidal_count = _count("uri_tidal", URI_PATTERN_TIDAL)
-            deezer_count = _count("uri_deezer", URI_PATTERN_DEEZER)
-            # Amazon Music uses Alexa text search — every song in the playlist is
-            # playable, so the count always equals the total song count.
-            amazon_music_count = len(songs)
-
-            # #716: skip playlists with no songs entirely — they only confuse the UI.
-            if not is_valid and len(songs) == 0:
-                _LOGGER.debug(
-                    "Skipping empty playlist from discovery: %s", json_file.name
-                )
-                continue
-
-            path_str = str(json_file)
-            # #1704: retain the parsed songs so the mixer reuses this parse
-            # instead of re-reading + re-parsing every tag file a second time.
-            songs_by_path[path_str] = songs
-            playlists.append(
-                {
-                    "path": path_str,
-                    "filename": json_file.name,
-                    "name": data.get("name", json_file.stem),
-                    "source": source,
-                    "author": data.get("author"),
-                    "description": data.get("description"),
-                    "language": data.get("language"),
-                    "added_date": data.get("added_date"),
-                    "version": data.get("version"),
-                    "tags": data.get("tags", []),  # Issue #70: Tag-based filtering
-                    "song_count": len(songs),
-                    "spotify_count": spotify_count,
-                    "apple_music_count": apple_music_count,
-                    "youtube_music_count": youtube_music_count,
-                    "tidal_count": tidal_count,
-                    "deezer_count": deezer_count,
-                    "amazon_music_count": amazon_music_count,
-                    "is_valid": is_valid,
-                    "errors": errors,
-                    # #1576: structured per-song rejections so the playlist
-                    # browser can show *which* tracks dropped and why, not just
-                    # the positional "Song N: ..." strings.
-                    "rejected_songs": rejected_songs,
-                }
-            )
-        except json.JSONDecodeError as e:
+            part = sig_by_path[str(json_file)]
+        except KeyError:
+            continue  # vanished between glob and stat
+        entry = cached_files.get(part) if cached_files else None
+        if entry is None:
             try:
-                rel = json_file.relative_to(playlist_dir)
-                source = (
-                    "community"
-                    if rel.parts and rel.parts[0] in ("community", "user")
-                    else "bundled"
-                )
-            except ValueError:
-                source = "bundled"
-            playlists.append(
-                {
-                    "path": str(json_file),
-                    "filename": json_file.name,
-                    "name": json_file.stem,
-                    "source": source,
-                    "author": None,
-                    "description": None,
-                    "language": None,
-                    "added_date": None,
-                    "version": None,
-                    "tags": [],  # Issue #70
-                    "song_count": 0,
-                    "spotify_count": 0,
-                    "apple_music_count": 0,
-                    "youtube_music_count": 0,
-                    "tidal_count": 0,
-                    "deezer_count": 0,
-                    "amazon_music_count": 0,
-                    "is_valid": False,
-                    "errors": [f"Invalid JSON: {e}"],
-                    "rejected_songs": [],
-                }
-            )
-        except OSError as e:  # pragma: no cover - I/O edge (file vanished mid-walk)
-            _LOGGER.debug("Skipping unreadable playlist %s: %s", json_file, e)
+                entry = _discover_playlist_file(json_file, playlist_dir)
+            except OSError as e:  # pragma: no cover - I/O edge (vanished mid-walk)
+                _LOGGER.debug("Skipping unreadable playlist %s: %s", json_file, e)
+                continue
+        files[part] = entry
+        meta, songs = entry
+        if meta is None:
             continue
+        if songs is not None:
+            songs_by_path[meta["path"]] = songs
+        playlists.append(meta)
 
     _LOGGER.debug("Found %d playlists", len(playlists))
-    return playlists, songs_by_path, signature
+    return playlists, songs_by_path, signature, files
 
 
 async def async_discover_playlists_detailed(
@@ -1030,25 +1220,27 @@ async def async_discover_playlists_detailed(
     domain_data = hass.data.setdefault(DOMAIN, {})
     cache = domain_data.get(_DISCOVERY_CACHE_KEY)
     cached_sig: _DiscoverySig | None = cache["sig"] if cache else None
+    cached_files = cache.get("files") if cache else None
 
     # Offload the whole walk/read/parse/validate/count to the executor (matches
     # the original discovery, which used loop.run_in_executor(None, …) for its
     # glob + reads — #516/#1402 B3). Doing it in one job keeps the event loop
-    # free of the ~47 json.loads + validate + 50k regex evals per request.
+    # free of the ~47 JSON parses + validate + 50k regex evals per request.
     loop = asyncio.get_running_loop()
     result = await loop.run_in_executor(
-        None, _discover_playlists_sync, playlist_dir, cached_sig
+        None, _discover_playlists_sync, playlist_dir, cached_sig, cached_files
     )
 
     if result is None:
         # Signature unchanged → serve the memoised parse.
         return cache["metas"], cache["songs_by_path"]
 
-    metas, songs_by_path, signature = result
+    metas, songs_by_path, signature, files = result
     domain_data[_DISCOVERY_CACHE_KEY] = {
         "sig": signature,
         "metas": metas,
         "songs_by_path": songs_by_path,
+        "files": files,
     }
     return metas, songs_by_path
 
@@ -1071,14 +1263,15 @@ async def async_load_and_validate_playlist(
     if not await loop.run_in_executor(None, path.exists):
         return (None, [f"File not found: {path}"])
 
-    def _read_file(p: Path) -> str:
-        """Read file contents (runs in executor)."""
-        return p.read_text(encoding="utf-8")
+    def _read_file(p: Path) -> bytes:
+        """Read raw file contents (runs in executor)."""
+        return p.read_bytes()
 
     try:
         content = await loop.run_in_executor(None, _read_file, path)
-        data = json.loads(content)
-    except json.JSONDecodeError as e:
+        # orjson parses the raw bytes directly (no str decode pass first).
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
         return (None, [f"Invalid JSON: {e}"])
 
     rejected_songs: list[dict[str, Any]] = []
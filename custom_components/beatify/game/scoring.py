@@ -7,6 +7,8 @@ Advanced scoring (Epic 5) adds speed bonus, streaks, and betting.
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from itertools import islice
 from statistics import mean, median
 from typing import TYPE_CHECKING, Any
 
@@ -33,7 +35,6 @@ from custom_components.beatify.const import (
     MIN_ROUNDS_FOR_CLUTCH,
     MIN_ROUNDS_FOR_COMEBACK,
     MIN_STREAK_FOR_AWARD,
-    MIN_SUBMISSIONS_FOR_SPEED,
     STEAL_UNLOCK_STREAK,
     STREAK_MILESTONES,
 )
@@ -99,6 +100,30 @@ def bet_win_multiplier(
     return BET_WIN_MULTIPLIER_BY_DIFFICULTY.get(difficulty, BET_WIN_MULTIPLIER)
 
 
+def _accuracy_table(scoring: dict[str, int]) -> tuple[int, ...]:
+    """Expand one DIFFICULTY_SCORING entry into points indexed by years off."""
+    close_range = scoring["close_range"]
+    near_range = scoring["near_range"]
+    points = [POINTS_EXACT]
+    for diff in range(1, max(close_range, near_range) + 1):
+        if diff <= close_range:
+            points.append(scoring["close_points"])
+        elif diff <= near_range:
+            points.append(scoring["near_points"])
+        else:
+            points.append(POINTS_WRONG)
+    return tuple(points)
+
+
+# Accuracy points per difficulty, indexed by ``abs(guess - actual)``; anything
+# past the end of a table scores POINTS_WRONG. Built once from
+# DIFFICULTY_SCORING so scoring a guess is a single index, not a range walk.
+_ACCURACY_TABLES: dict[str, tuple[int, ...]] = {
+    difficulty: _accuracy_table(scoring)
+    for difficulty, scoring in DIFFICULTY_SCORING.items()
+}
+
+
 def calculate_accuracy_score(
     guess: int,
     actual: int,
@@ -123,20 +148,9 @@ def calculate_accuracy_score(
     """
     diff = abs(guess - actual)
 
-    # Get config for current difficulty, fallback to default if unknown
-    scoring = DIFFICULTY_SCORING.get(difficulty, DIFFICULTY_SCORING[DIFFICULTY_DEFAULT])
-    close_range = scoring["close_range"]
-    close_points = scoring["close_points"]
-    near_range = scoring["near_range"]
-    near_points = scoring["near_points"]
-
-    if diff == 0:
-        return POINTS_EXACT
-    if close_range > 0 and diff <= close_range:
-        return close_points
-    if near_range > 0 and diff <= near_range:
-        return near_points
-    return POINTS_WRONG
+    # Get table for current difficulty, fallback to default if unknown
+    table = _ACCURACY_TABLES.get(difficulty, _ACCURACY_TABLES[DIFFICULTY_DEFAULT])
+    return table[diff] if diff < len(table) else POINTS_WRONG
 
 
 def calculate_speed_multiplier(elapsed_time: float, round_duration: float) -> float:
@@ -166,9 +180,12 @@ def calculate_speed_multiplier(elapsed_time: float, round_duration: float) -> fl
     if elapsed_time <= grace:
         return SPEED_MULTIPLIER_MAX
 
-    # Linear decay from the max at the grace edge to 1.0x at the deadline.
+    if elapsed_time >= round_duration:
+        return 1.0
+
+    # Linear decay from the max at the grace edge to 1.0x at the deadline. The
+    # two early returns bound the ratio to (0, 1), so it needs no clamping.
     decay_ratio = (elapsed_time - grace) / (round_duration - grace)
-    decay_ratio = max(0.0, min(1.0, decay_ratio))
     return SPEED_MULTIPLIER_MAX - ((SPEED_MULTIPLIER_MAX - 1.0) * decay_ratio)
 
 
@@ -272,6 +289,13 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 
+# streak_achievements counter key per milestone (Issue #147), formatted once
+# here rather than on every correct answer.
+_STREAK_ACHIEVEMENT_KEYS: dict[int, str] = {
+    streak: f"streak_{streak}" for streak in STREAK_MILESTONES
+}
+
+
 def _apply_streak(
     player: PlayerSession,
     speed_score: int,
@@ -281,10 +305,6 @@ def _apply_streak(
     if speed_score > 0:
         player.previous_streak = 0
         player.streak += 1
-        # Track streak achievements (Issue #147)
-        milestone_key = f"streak_{player.streak}"
-        if milestone_key in streak_achievements:
-            streak_achievements[milestone_key] += 1
         player.streak_bonus = calculate_streak_bonus(player.streak)
         if player.streak == STEAL_UNLOCK_STREAK:
             player.unlock_steal()
@@ -295,6 +315,10 @@ def _apply_streak(
         # 3 keeps one, not two.
         if player.streak in STREAK_MILESTONES:
             player.streak_shield = True
+            # Track streak achievements (Issue #147)
+            milestone_key = _STREAK_ACHIEVEMENT_KEYS[player.streak]
+            if milestone_key in streak_achievements:
+                streak_achievements[milestone_key] += 1
     elif player.streak_shield:
         # #1666: spend the shield instead of resetting. The streak COUNTER
         # survives so the next correct answer continues the run; no streak
@@ -433,6 +457,44 @@ def _intro_qualified(
     return calculate_accuracy_score(player.current_guess, correct_year, difficulty) > 0
 
 
+def intro_qualified_times(
+    all_players: list[PlayerSession],
+    *,
+    is_intro_round: bool,
+    intro_round_start_time: float | None,
+    correct_year: int | None,
+    difficulty: str,
+    title_artist_manager: Any | None,
+) -> list[float]:
+    """Sorted submission times of every intro-qualified player this round.
+
+    The intro speed ranking (#1720) only depends on stable submit-time inputs,
+    so it is built once per round: a player's rank is then the number of
+    qualified times strictly before their own, found by bisection instead of
+    re-qualifying every other player for every scored player.
+    """
+    if not (is_intro_round and intro_round_start_time):
+        return []
+    cutoff = intro_round_start_time + INTRO_DURATION_SECONDS
+    times = [
+        p.submission_time
+        for p in all_players
+        # #1748: an eliminated player (Sudden Death) is out of the game and must
+        # not occupy a slot in the intro speed ranking that survivors compete for.
+        if not p.eliminated
+        and p.submission_time is not None
+        and _intro_qualified(
+            p,
+            cutoff=cutoff,
+            correct_year=correct_year,
+            difficulty=difficulty,
+            title_artist_manager=title_artist_manager,
+        )
+    ]
+    times.sort()
+    return times
+
+
 def _score_intro_round(
     player: PlayerSession,
     *,
@@ -442,12 +504,16 @@ def _score_intro_round(
     correct_year: int | None,
     difficulty: str,
     title_artist_manager: Any | None,
+    qualified_times: list[float] | None = None,
 ) -> int:
     """Return intro bonus points. Mutates player.intro_bonus and player.intro_speed_bonuses.
 
     #1720: only accuracy-qualified submitters compete for (and receive) the
     tiered 5/3/1 intro bonus. A fast-but-wrong tap no longer farms guaranteed
     points nor displaces a slower-but-correct recognizer in the speed ranking.
+
+    ``qualified_times`` is the round's ``intro_qualified_times`` when the
+    caller has already built it; otherwise it is built here.
     """
     player.intro_bonus = 0
     if not (is_intro_round and intro_round_start_time and player.submission_time):
@@ -462,23 +528,18 @@ def _score_intro_round(
     ):
         return 0
     player.intro_speed_bonuses += 1
-    rank = sum(
-        1
-        for p in all_players
-        if p is not player
-        # #1748: an eliminated player (Sudden Death) is out of the game and must
-        # not occupy a slot in the intro speed ranking that survivors compete for.
-        and not p.eliminated
-        and _intro_qualified(
-            p,
-            cutoff=cutoff,
+    if qualified_times is None:
+        qualified_times = intro_qualified_times(
+            all_players,
+            is_intro_round=is_intro_round,
+            intro_round_start_time=intro_round_start_time,
             correct_year=correct_year,
             difficulty=difficulty,
             title_artist_manager=title_artist_manager,
         )
-        and p.submission_time is not None
-        and p.submission_time < player.submission_time
-    )
+    # Qualified players who submitted strictly earlier; the player's own time
+    # (and any exact tie) is not counted.
+    rank = bisect_left(qualified_times, player.submission_time)
     if rank < len(INTRO_BONUS_TIERS):
         player.intro_bonus = INTRO_BONUS_TIERS[rank]
     return player.intro_bonus
@@ -517,11 +578,10 @@ def _award(
 
 
 def _superlative_speed_demon(players: list[PlayerSession]) -> dict[str, Any] | None:
+    # avg_submission_time is None below MIN_SUBMISSIONS_FOR_SPEED, so one
+    # read per player both filters and ranks.
     candidates = [
-        (p, p.avg_submission_time)
-        for p in players
-        if p.avg_submission_time is not None
-        and len(p.submission_times) >= MIN_SUBMISSIONS_FOR_SPEED
+        (p, avg) for p in players if (avg := p.avg_submission_time) is not None
     ]
     if not candidates:
         return None
@@ -630,10 +690,14 @@ def _superlative_comeback_king(
         return None
     candidates = []
     for p in players:
-        if len(p.round_scores) >= MIN_ROUNDS_FOR_COMEBACK:
-            mid = len(p.round_scores) // 2
-            first_half = sum(p.round_scores[:mid]) / mid
-            second_half = sum(p.round_scores[mid:]) / (len(p.round_scores) - mid)
+        scores = p.round_scores
+        if len(scores) >= MIN_ROUNDS_FOR_COMEBACK:
+            mid = len(scores) // 2
+            # Sum the first half in place and derive the second from the total
+            # rather than copying both halves out as slices.
+            first_total = sum(islice(scores, mid))
+            first_half = first_total / mid
+            second_half = (sum(scores) - first_total) / (len(scores) - mid)
             improvement = second_half - first_half
             if improvement > MIN_COMEBACK_IMPROVEMENT:
                 candidates.append((p, round(improvement, 1)))
@@ -864,48 +928,64 @@ class ScoringService:
         if not submitted:
             return RoundAnalytics(correct_decade=_get_decade_label(correct_year))
 
-        all_guesses = sorted(
-            [
+        # One pass over the submissions for every per-player figure; only the
+        # mean/median need the guesses as a list.
+        all_guesses: list[dict[str, Any]] = []
+        guesses: list[int] = []
+        closest: list[str] = []
+        furthest: list[str] = []
+        exact: list[str] = []
+        min_off = max_off = -1
+        scored = 0
+        fastest_time: float | None = None
+        fastest_names: list[str] = []
+        decade_dist: dict[str, int] = {}
+        for p in submitted:
+            name = p.name
+            guess = p.current_guess
+            off = p.years_off or 0
+            all_guesses.append(
                 {
-                    "name": p.name,
-                    "guess": p.current_guess,
-                    "years_off": p.years_off or 0,
+                    "name": name,
+                    "guess": guess,
+                    "years_off": off,
                     "round_score": p.round_score,
                 }
-                for p in submitted
-            ],
-            key=lambda x: x["years_off"],
-        )
-        guesses = [p.current_guess for p in submitted]
+            )
+            guesses.append(guess)
+            if min_off < 0 or off < min_off:
+                min_off, closest = off, [name]
+            elif off == min_off:
+                closest.append(name)
+            if off > max_off:
+                max_off, furthest = off, [name]
+            elif off == max_off:
+                furthest.append(name)
+            if p.years_off == 0:
+                exact.append(name)
+            if p.round_score > 0:
+                scored += 1
+            if p.submission_time is not None and round_start_time is not None:
+                elapsed = p.submission_time - round_start_time
+                if fastest_time is None or elapsed < fastest_time:
+                    fastest_time, fastest_names = elapsed, [name]
+                elif elapsed == fastest_time:
+                    fastest_names.append(name)
+            decade = _get_decade_label(guess)
+            decade_dist[decade] = decade_dist.get(decade, 0) + 1
+
+        all_guesses.sort(key=lambda x: x["years_off"])
         avg_guess = mean(guesses)
         med_guess = int(median(guesses))
-        min_off = min(p.years_off or 0 for p in submitted)
-        closest = [p.name for p in submitted if (p.years_off or 0) == min_off]
-        max_off = max(p.years_off or 0 for p in submitted)
-        furthest = [p.name for p in submitted if (p.years_off or 0) == max_off]
-        exact = [p.name for p in submitted if p.years_off == 0]
-        scored = sum(1 for p in submitted if p.round_score > 0)
         accuracy_pct = int((scored / len(submitted)) * 100)
 
         speed_champion = None
-        timed = [
-            p
-            for p in submitted
-            if p.submission_time is not None and round_start_time is not None
-        ]
-        if timed:
-            elapsed = [(p, p.submission_time - round_start_time) for p in timed]
-            fastest_time = min(t for _, t in elapsed)
+        if fastest_time is not None:
             speed_champion = {
-                "names": [p.name for p, t in elapsed if t == fastest_time],
+                "names": fastest_names,
                 "time": round(fastest_time, 1),
             }
 
-        decade_dist: dict[str, int] = {}
-        for g in guesses:
-            d = _get_decade_label(g)
-            decade_dist[d] = decade_dist.get(d, 0) + 1
-
         return RoundAnalytics(
             all_guesses=all_guesses,
             average_guess=avg_guess,
@@ -939,6 +1019,7 @@ class ScoringService:
         bet_tracking: dict[str, int],
         title_artist_manager: Any | None = None,
         difficulty_bet_scaling_enabled: bool = False,
+        intro_times: list[float] | None = None,
     ) -> None:
         """Score a single player for the current round. Mutates player in-place.
 
@@ -949,6 +1030,9 @@ class ScoringService:
         #1727: when ``difficulty_bet_scaling_enabled`` is True the won-bet payout
         scales with difficulty (easy 2x / normal 3x / hard 5x); when False the
         flat 3x applies on every difficulty (unchanged).
+
+        ``intro_times`` is the round's ``intro_qualified_times``, built once by
+        a caller scoring every player; when omitted it is built per call.
         """
         if title_artist_manager is not None:
             if player.submitted:
@@ -968,6 +1052,7 @@ class ScoringService:
                     correct_year=correct_year,
                     difficulty=difficulty,
                     title_artist_manager=title_artist_manager,
+                    qualified_times=intro_times,
                 )
                 player.score += player.movie_bonus + player.intro_bonus
             else:
@@ -1031,6 +1116,7 @@ class ScoringService:
                 correct_year=correct_year,
                 difficulty=difficulty,
                 title_artist_manager=None,
+                qualified_times=intro_times,
             )
 
             player.score += (
@@ -146,8 +146,7 @@ class GameStateSerializer:
         state["finale_double_active"] = gs.finale_double_enabled and gs.last_round
         state["finale_playoff_active"] = gs._finale_playoff_active
         # Submission tracking (Story 4.4)
-        state["submitted_count"] = sum(1 for p in gs.players.values() if p.submitted)
-        state["all_submitted"] = gs.all_submitted()
+        state["submitted_count"], state["all_submitted"] = gs.submission_status()
         # Song info WITHOUT year during PLAYING (hidden until reveal)
         if gs.current_song:
             state["song"] = {
@@ -6,6 +6,7 @@ Read-only — does not modify scoring or game mechanics.
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -37,11 +38,10 @@ def build_emoji_grid(
     # Build emoji row from round results
     emoji_row = "".join(_RESULT_EMOJI.get(r, "⬜") for r in player.round_results)
 
-    # Count stats
-    scored_count = sum(
-        1 for r in player.round_results if r in ("exact", "scored", "close")
-    )
-    exact_count = sum(1 for r in player.round_results if r == "exact")
+    # Count stats in one (C-level) tally instead of a pass per statistic
+    counts = Counter(player.round_results)
+    exact_count = counts["exact"]
+    scored_count = exact_count + counts["scored"] + counts["close"]
 
     lines = [
         f"🎵 Beatify — {playlist_name}",
@@ -71,16 +71,15 @@ def build_share_data(game_state: Any) -> dict[str, Any]:
     # Extract playlist name
     playlist_name = "Unknown Playlist"
     if game_state.playlists:
-        playlist_path = game_state.playlists[0]
-        if "/" in playlist_path:
-            playlist_name = (
-                playlist_path.split("/")[-1]
-                .replace(".json", "")
-                .replace("-", " ")
-                .title()
-            )
-        else:
-            playlist_name = playlist_path.replace(".json", "").replace("-", " ").title()
+        # rsplit yields the whole string when there is no "/", so bare file
+        # names and full paths share one path through the string ops.
+        playlist_name = (
+            game_state.playlists[0]
+            .rsplit("/", 1)[-1]
+            .replace(".json", "")
+            .replace("-", " ")
+            .title()
+        )
 
     total_rounds = game_state.round
 
@@ -49,6 +49,7 @@ from .powerups import PowerUpManager
 from .round_manager import RoundManager
 from .scoring import (
     ScoringService,
+    intro_qualified_times,
 )
 from .protocols import MediaPlayerProtocol, PartyLightsProtocol
 from .state_auto_advance import RevealAutoAdvanceMixin
@@ -644,6 +645,22 @@ class GameState(
         title_artist_manager = (
             self._challenge_manager if self.title_artist_mode else None
         )
+        # The intro speed ranking is the same for every player — build it once
+        # for the round instead of once per scored player. On a bad player
+        # shape fall back to the per-player build so #816's per-player guard
+        # below still contains the failure.
+        intro_times: list[float] | None
+        try:
+            intro_times = intro_qualified_times(
+                all_players,
+                is_intro_round=self.is_intro_round,
+                intro_round_start_time=self._round_manager._intro_round_start_time,
+                correct_year=correct_year,
+                difficulty=self.difficulty,
+                title_artist_manager=title_artist_manager,
+            )
+        except (KeyError, AttributeError, TypeError, ValueError):
+            intro_times = None
         for player in self.players.values():
             # #1748: an eliminated player (Sudden Death) is out of the game — do
             # not accumulate any further score for them. Their frozen totals must
@@ -668,6 +685,7 @@ class GameState(
                     bet_tracking=self.bet_tracking,
                     title_artist_manager=title_artist_manager,
                     difficulty_bet_scaling_enabled=self.difficulty_bet_scaling_enabled,
+                    intro_times=intro_times,
                 )
             except (KeyError, AttributeError, TypeError, ValueError) as err:
                 _LOGGER.error(
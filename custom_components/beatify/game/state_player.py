@@ -168,6 +168,10 @@ class PlayerLifecycleMixin:
         """Check if all connected players have submitted. Delegates to PlayerRegistry."""
         return self._player_registry.all_submitted()
 
+    def submission_status(self) -> tuple[int, bool]:
+        """Submitted count and all-submitted flag. Delegates to PlayerRegistry."""
+        return self._player_registry.submission_status()
+
     def set_admin(self, name: str) -> bool:
         """Mark a player as admin. Delegates to PlayerRegistry."""
         return self._player_registry.set_admin(name)
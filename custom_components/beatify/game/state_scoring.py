@@ -52,7 +52,7 @@ The mixin relies on attributes / methods the host class owns and that live on
 * ``self._stats_service`` — optional persisted song-result stats sink.
 * ``self.playlists`` — used to derive the playlist name for stats.
 * ``self.highlights_tracker`` — the :class:`HighlightsTracker` sink for the
-  round's highlight events.
+  round's highlight events; ``self._now`` stamps them.
 * ``self._lights_flash`` / ``self._bg_tasks`` — fire-and-forget party-light
   flash on streak milestones (#75).
 
@@ -254,6 +254,10 @@ class RoundScoringMixin:
         if correct_year is None:
             return
 
+        # One clock reading stamps every highlight recorded this round.
+        now = self._now()
+        tracker = self.highlights_tracker
+
         song_title = ""
         if self.current_song:
             song_title = self.current_song.get("title", "Unknown")
@@ -270,20 +274,20 @@ class RoundScoringMixin:
         for player in submitted_players:
             # Exact match
             if player.years_off == 0:
-                self.highlights_tracker.record_exact_match(
-                    player.name, song_title, correct_year, self.round
+                tracker.record_exact_match(
+                    player.name, song_title, correct_year, self.round, timestamp=now
                 )
 
             # Heartbreaker (off by 1)
             if player.years_off == 1:
-                self.highlights_tracker.record_heartbreaker(
-                    player.name, song_title, 1, self.round
+                tracker.record_heartbreaker(
+                    player.name, song_title, 1, self.round, timestamp=now
                 )
 
             # Streak milestones
             if player.streak in STREAK_MILESTONES:
-                self.highlights_tracker.record_streak(
-                    player.name, player.streak, self.round
+                tracker.record_streak(
+                    player.name, player.streak, self.round, timestamp=now
                 )
                 # Fire-and-forget flash (sync context — cannot await)
                 task = asyncio.create_task(self._lights_flash("orange"))
@@ -292,8 +296,8 @@ class RoundScoringMixin:
 
             # Bet win
             if player.bet_outcome == "won" and player.round_score >= 10:
-                self.highlights_tracker.record_bet_win(
-                    player.name, player.round_score, self.round
+                tracker.record_bet_win(
+                    player.name, player.round_score, self.round, timestamp=now
                 )
 
             # Comeback (gained 2+ positions)
@@ -302,8 +306,8 @@ class RoundScoringMixin:
                 if current_rank is not None:
                     positions_gained = player.previous_rank - current_rank
                     if positions_gained >= 2:
-                        self.highlights_tracker.record_comeback(
-                            player.name, positions_gained, self.round
+                        tracker.record_comeback(
+                            player.name, positions_gained, self.round, timestamp=now
                         )
 
         # Speed record (fastest submission this round)
@@ -315,8 +319,8 @@ class RoundScoringMixin:
         if timed:
             fastest_player, fastest_time = min(timed, key=lambda x: x[1])
             if fastest_time < 5.0:  # Only highlight very fast answers
-                self.highlights_tracker.record_speed_record(
-                    fastest_player.name, fastest_time, self.round
+                tracker.record_speed_record(
+                    fastest_player.name, fastest_time, self.round, timestamp=now
                 )
 
         # Photo finish (tied round scores among top players) — Issue #414
@@ -333,7 +337,7 @@ class RoundScoringMixin:
                     # Only record if it's among the top scores
                     top_score = max(scores)
                     if score >= top_score * 0.8:
-                        self.highlights_tracker.record_photo_finish(
-                            tied_names, self.round
+                        tracker.record_photo_finish(
+                            tied_names, self.round, timestamp=now
                         )
                         break  # Only one photo finish per round
@@ -10,17 +10,24 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
+# Labels for decades 0s..2090s, indexed by ``year // 10`` — built once so the
+# per-guess decade histogram reuses interned strings instead of formatting.
+_DECADE_LABELS = tuple(f"{decade * 10}s" for decade in range(210))
+
+
 def get_decade_label(year: int) -> str:
     """Get decade label for a year (e.g., 1985 -> '1980s')."""
-    decade = (year // 10) * 10
-    return f"{decade}s"
+    decade = year // 10
+    if 0 <= decade < len(_DECADE_LABELS):
+        return _DECADE_LABELS[decade]
+    return f"{decade * 10}s"
 
 
 # Keep the underscore-prefixed alias for backward compatibility
 _get_decade_label = get_decade_label
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundAnalytics:
     """Analytics calculated at end of each round for reveal display (Story 13.3)."""
 
@@ -47,7 +54,7 @@ class RoundAnalytics:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to JSON-serializable dictionary."""
-        avg = round(self.average_guess, 1) if self.average_guess else None
+        avg = None if self.average_guess is None else round(self.average_guess, 1)
         return {
             "all_guesses": self.all_guesses,
             "average_guess": avg,
@@ -43,7 +43,7 @@ from custom_components.beatify.game.playlist import (
     _max_year,
     async_discover_playlists_detailed,
     get_playlist_directory,
-    get_song_uri,
+    song_uri_resolver,
     validate_playlist,
 )
 from custom_components.beatify.server.base import (
@@ -111,7 +111,7 @@ def _assemble_mix_songs(
     A playlist matches if ANY of its tags is in ``selected_tags`` (union
     semantics): "80s + 90s pop" should pull from every playlist touching the
     80s, the 90s OR pop, then dedupe. Songs are de-duplicated by their
-    provider-resolved URI (``get_song_uri``) — the same key the in-game
+    provider-resolved URI (``song_uri_resolver``) — the same key the in-game
     PlaylistManager uses — then shuffled and capped at ``target_count``.
 
     #1704: the songs come pre-parsed from discovery (``songs_by_path``) rather
@@ -120,8 +120,10 @@ def _assemble_mix_songs(
 
     Returns ``(songs, matched_playlist_count)``.
     """
-    candidates: list[dict[str, Any]] = []
+    # (resolved URI, song) pairs, so each song's URI is resolved only once.
+    candidates: list[tuple[str, dict[str, Any]]] = []
     matched = 0
+    resolve = song_uri_resolver(provider)
 
     for meta in playlists_meta:
         if not meta.get("is_valid"):
@@ -155,16 +157,16 @@ def _assemble_mix_songs(
                 continue
             # Must have at least one usable URI for the selected provider —
             # otherwise it can never play and only wastes a slot.
-            if not get_song_uri(song, provider):
+            uri = resolve(song)
+            if not uri:
                 continue
-            candidates.append(song)
+            candidates.append((uri, song))
 
     # De-dupe by provider-resolved URI (mirrors PlaylistManager.__init__).
     seen: set[str] = set()
     unique: list[dict[str, Any]] = []
-    for song in candidates:
-        uri = get_song_uri(song, provider)
-        if not uri or uri in seen:
+    for uri, song in candidates:
+        if uri in seen:
             continue
         seen.add(uri)
         unique.append(song)
@@ -130,10 +130,9 @@ def build_status_response(
     if game_state and game_state.game_id:
         active_game = game_state.get_state()
 
-    has_music_assistant = any(
-        entry.domain == "music_assistant"
-        for entry in hass.config_entries.async_entries()
-    )
+    # Domain-filtered lookup hits the config-entry domain index instead of
+    # walking every entry on each status poll.
+    has_music_assistant = bool(hass.config_entries.async_entries("music_assistant"))
 
     return {
         "version": version,
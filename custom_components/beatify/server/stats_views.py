@@ -152,7 +152,7 @@ class AnalyticsView(RateLimitMixin, HomeAssistantView):
             return web.json_response(self._cache)
 
         # Compute fresh metrics
-        data = analytics.compute_metrics(period)
+        data = await analytics.async_compute_metrics(period)
         self._cache = data
         self._cache_time = now
 
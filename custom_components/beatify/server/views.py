@@ -8,12 +8,13 @@ views from sub-modules for backward compatibility.
 from __future__ import annotations
 
 import asyncio
+import importlib
 import json
 import logging
 import socket
 from ipaddress import ip_address
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode, urlsplit
 
 from aiohttp import ClientError, ClientTimeout, web
@@ -43,42 +44,68 @@ from custom_components.beatify.services.media_player import (
     async_get_media_players_with_remap,
 )
 
-# Re-export game views
-from custom_components.beatify.server.game_views import (  # noqa: F401
-    EndGameView,
-    ForceResetView,
-    GameStatusView,
-    RematchGameView,
-    SetSuddenDeathView,
-    StartGameplayView,
-    StartGameView,
-)
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
 
-# Re-export playlist views
-from custom_components.beatify.server.playlist_views import (  # noqa: F401
-    PlaylistRequestsView,
-    SavePlaylistView,
-)
+    from custom_components.beatify.server.game_views import (  # noqa: F401
+        EndGameView,
+        ForceResetView,
+        GameStatusView,
+        RematchGameView,
+        SetSuddenDeathView,
+        StartGameplayView,
+        StartGameView,
+    )
+    from custom_components.beatify.server.playlist_views import (  # noqa: F401
+        PlaylistRequestsView,
+        SavePlaylistView,
+    )
+    from custom_components.beatify.server.mix_views import (  # noqa: F401
+        MixPlaylistView,
+    )
+    from custom_components.beatify.server.stats_views import (  # noqa: F401
+        AnalyticsPageView,
+        AnalyticsView,
+        DashboardView,
+        SongStatsView,
+        StatsView,
+        UsageView,
+    )
 
-# Re-export mix view (#1538 — Smart Playlist Mixer)
-from custom_components.beatify.server.mix_views import (  # noqa: F401
-    MixPlaylistView,
-)
+_LOGGER = logging.getLogger(__name__)
 
-# Re-export stats views
-from custom_components.beatify.server.stats_views import (  # noqa: F401
-    AnalyticsPageView,
-    AnalyticsView,
-    DashboardView,
-    SongStatsView,
-    StatsView,
-    UsageView,
-)
+# Views defined in sibling modules, re-exported from here so callers keep a
+# single import location. Resolved on first access (PEP 562) so importing this
+# module for one view does not import every other view module with it.
+_REEXPORTED_VIEWS: dict[str, str] = {
+    "EndGameView": "custom_components.beatify.server.game_views",
+    "ForceResetView": "custom_components.beatify.server.game_views",
+    "GameStatusView": "custom_components.beatify.server.game_views",
+    "RematchGameView": "custom_components.beatify.server.game_views",
+    "SetSuddenDeathView": "custom_components.beatify.server.game_views",
+    "StartGameplayView": "custom_components.beatify.server.game_views",
+    "StartGameView": "custom_components.beatify.server.game_views",
+    "PlaylistRequestsView": "custom_components.beatify.server.playlist_views",
+    "SavePlaylistView": "custom_components.beatify.server.playlist_views",
+    "MixPlaylistView": "custom_components.beatify.server.mix_views",
+    "AnalyticsPageView": "custom_components.beatify.server.stats_views",
+    "AnalyticsView": "custom_components.beatify.server.stats_views",
+    "DashboardView": "custom_components.beatify.server.stats_views",
+    "SongStatsView": "custom_components.beatify.server.stats_views",
+    "StatsView": "custom_components.beatify.server.stats_views",
+    "UsageView": "custom_components.beatify.server.stats_views",
+}
 
-if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
 
-_LOGGER = logging.getLogger(__name__)
+def __getattr__(name: str) -> Any:
+    """Import a re-exported view from its defining module on first access."""
+    try:
+        module_path = _REEXPORTED_VIEWS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
 
 
 # ---------------------------------------------------------------------------
@@ -522,12 +522,12 @@ class PartyLightsService:
             registry = er.async_get(self._hass)
             light_entry = registry.async_get(entity_id)
             if light_entry and light_entry.device_id:
-                for entry in registry.entities.values():
-                    if (
-                        entry.device_id == light_entry.device_id
-                        and entry.domain == "select"
-                        and "preset" in (entry.entity_id or "")
-                    ):
+                # Device-indexed lookup: only this device's entities, not a
+                # walk over every entity in the registry.
+                for entry in er.async_entries_for_device(
+                    registry, light_entry.device_id, include_disabled_entities=True
+                ):
+                    if entry.domain == "select" and "preset" in (entry.entity_id or ""):
                         preset_entity = entry.entity_id
                         break
         except (ImportError, AttributeError, KeyError):  # noqa: BLE001
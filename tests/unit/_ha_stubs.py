@@ -1,7 +1,7 @@
 """Real HA stubs for B6 platform tests (#1402).
 
 The repo-root conftest.py registers most ``homeassistant.*`` leaf modules as
-bare ``MagicMock`` objects so game logic imports cleanly. That is fine for code
+attribute-permissive stubs so game logic imports cleanly. That is fine for code
 that only *references* HA symbols, but the B6 platform modules need a few of
 those symbols to behave like real classes/callables for assertions to be
 meaningful:
@@ -13,7 +13,7 @@ meaningful:
 * ``SensorEntity`` / ``BinarySensorEntity`` must be real classes to subclass.
 * ``callback`` must be an identity decorator.
 
-:func:`install` force-replaces just those symbols (the MagicMock leaves answer
+:func:`install` force-replaces just those symbols (the stub leaves answer
 ``hasattr`` for everything, so we overwrite unconditionally). Call it once at
 the top of a test module, BEFORE importing the beatify module under test.
 """
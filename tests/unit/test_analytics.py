@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from datetime import datetime, timezone
@@ -17,6 +18,7 @@ from custom_components.beatify.analytics import (
     RETENTION_DAYS,
     AnalyticsStorage,
     GameRecord,
+    _utc_year_month,
 )
 
 
@@ -262,6 +264,52 @@ class TestErrorSaveShutdown:
         mock_save.assert_not_awaited()
 
 
+# ---------------------------------------------------------------------------
+# TestScheduleSaveCoalescing — no save task per event while one is in flight
+# ---------------------------------------------------------------------------
+
+
+class TestScheduleSaveCoalescing:
+    def setup_method(self):
+        self.hass = _mock_hass()
+        self.storage = AnalyticsStorage(self.hass)
+
+    @pytest.mark.asyncio
+    async def test_burst_while_in_flight_runs_one_follow_up_save(self):
+        release = asyncio.Event()
+        calls = 0
+
+        async def _slow_save():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+
+        with patch.object(self.storage, "_save", _slow_save):
+            for _ in range(50):
+                self.storage.schedule_save()
+            await asyncio.sleep(0)
+            assert calls == 1
+            assert self.storage._save_dirty is True
+
+            release.set()
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        # One in-flight save plus a single coalesced follow-up.
+        assert calls == 2
+        assert self.storage._save_dirty is False
+
+    @pytest.mark.asyncio
+    async def test_shutdown_flushes_save_requested_mid_flight(self):
+        self.storage._save_task = MagicMock()
+        self.storage._save_task.done.return_value = False
+        self.storage.schedule_save()
+        with patch.object(self.storage, "_save", AsyncMock()) as mock_save:
+            await self.storage.async_shutdown()
+        mock_save.assert_awaited_once()
+        assert self.storage._save_dirty is False
+
+
 # ---------------------------------------------------------------------------
 # TestSessionErrors
 # ---------------------------------------------------------------------------
@@ -327,6 +375,38 @@ class TestGetGamesAndErrors:
         assert len(errors) == 1
         assert errors[0]["message"] == "new"
 
+    def test_range_bounds_are_inclusive(self):
+        games = self.storage.get_games(
+            start_date=self.now - 86400 * 15, end_date=self.now - 3600
+        )
+        assert [g["game_id"] for g in games] == ["mid", "new"]
+
+    @pytest.mark.asyncio
+    async def test_add_game_keeps_games_ordered_by_end_time(self):
+        late = _make_game_record(game_id="late", ended_at=self.now - 86400 * 30)
+        with patch.object(self.storage, "schedule_save"):
+            await self.storage.add_game(late)
+        ids = [g["game_id"] for g in self.storage._data["games"]]
+        assert ids == ["old", "late", "mid", "new"]
+        assert [
+            g["game_id"]
+            for g in self.storage.get_games(start_date=self.now - 86400 * 40)
+        ] == ["late", "mid", "new"]
+
+
+# ---------------------------------------------------------------------------
+# TestUtcYearMonth — integer month bucketing must match datetime
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "ts",
+    [0, -1, 951782400, 951868800, 1709251199, 1709251200, 4102444800],
+)
+def test_utc_year_month_matches_datetime(ts):
+    dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+    assert _utc_year_month(ts) == (dt.year, dt.month)
+
 
 # ---------------------------------------------------------------------------
 # TestPruneOldData
@@ -483,7 +563,7 @@ class TestLoadResilience:
         ):
             self.storage._path = MagicMock()
             self.storage._path.exists.return_value = True
-            self.storage._path.read_text.return_value = json.dumps(payload)
+            self.storage._path.read_bytes.return_value = json.dumps(payload).encode()
             self.hass.async_add_executor_job = AsyncMock(
                 side_effect=lambda fn, *args: fn(*args)
             )
@@ -516,7 +596,7 @@ class TestLoadResilience:
         with patch.object(self.storage, "_save", save_mock):
             self.storage._path = MagicMock()
             self.storage._path.exists.return_value = True
-            self.storage._path.read_text.return_value = "{not valid json"
+            self.storage._path.read_bytes.return_value = b"{not valid json"
             self.storage._path.suffix = ".json"
             self.storage._path.with_suffix.return_value = "analytics.json.corrupt"
             self.hass.async_add_executor_job = AsyncMock(side_effect=_exec)
@@ -543,7 +623,7 @@ class TestLoadResilience:
         with patch.object(self.storage, "_save", save_mock):
             self.storage._path = MagicMock()
             self.storage._path.exists.return_value = True
-            self.storage._path.read_text.return_value = "[1, 2, 3]"
+            self.storage._path.read_bytes.return_value = b"[1, 2, 3]"
             self.storage._path.suffix = ".json"
             self.storage._path.with_suffix.return_value = "analytics.json.corrupt"
             self.hass.async_add_executor_job = AsyncMock(side_effect=_exec)
@@ -591,10 +671,11 @@ class TestComputeMetrics:
 
     def _add_recent_games(self, count: int = 5, days_ago: int = 3, **kwargs):
         ts = self.now - 86400 * days_ago
+        games = self.storage._data["games"]
         for i in range(count):
-            self.storage._data["games"].append(
-                _make_game_record(game_id=f"g-{i}", ended_at=ts + i, **kwargs)
-            )
+            games.append(_make_game_record(game_id=f"g-{i}", ended_at=ts + i, **kwargs))
+        # The store keeps games ordered by ended_at (add_game/load enforce it).
+        games.sort(key=lambda g: g["ended_at"])
 
     def test_empty_data_returns_zero_metrics(self):
         metrics = self.storage.compute_metrics("30d")
@@ -608,6 +689,34 @@ class TestComputeMetrics:
         metrics = self.storage.compute_metrics("30d")
         assert metrics["total_games"] == 5
 
+    def test_cached_result_reused_until_data_changes(self):
+        first = self.storage.compute_metrics("30d")
+        assert self.storage.compute_metrics("30d") is first
+
+        with patch.object(self.storage, "_schedule_error_save"):
+            self.storage.record_error("ERR", "boom")
+        assert self.storage.compute_metrics("30d") is not first
+
+    @pytest.mark.asyncio
+    async def test_async_compute_metrics_aggregates_in_executor(self):
+        self._add_recent_games(count=3)
+        metrics = await self.storage.async_compute_metrics("30d")
+
+        job = self.hass.async_add_executor_job.await_args
+        assert job.args[0] == self.storage._build_metrics
+        # The worker gets snapshot lists, not the live store.
+        assert job.args[3] is not self.storage._data["games"]
+        assert metrics == self.storage.compute_metrics("30d")
+        assert metrics["total_games"] == 3
+
+    @pytest.mark.asyncio
+    async def test_add_game_invalidates_cached_result(self):
+        first = self.storage.compute_metrics("30d")
+        with patch.object(self.storage, "schedule_save"):
+            await self.storage.add_game(_make_game_record())
+        assert self.storage.compute_metrics("30d")["total_games"] == 1
+        assert first["total_games"] == 0
+
     def test_correct_avg_players(self):
         self._add_recent_games(count=2, player_count=6)
         metrics = self.storage.compute_metrics("30d")
@@ -668,6 +777,19 @@ class TestComputeMetrics:
         }
         assert expected_keys.issubset(set(metrics.keys()))
 
+    def test_error_stats_recent_errors_newest_first_within_period(self):
+        self.storage._data["errors"] = [
+            {"timestamp": self.now - 86400 * 40, "type": "ERR", "message": "stale"}
+        ] + [
+            {"timestamp": self.now - 1000 + i, "type": "ERR", "message": f"e{i}"}
+            for i in range(12)
+        ]
+        stats = self.storage.compute_metrics("30d")["error_stats"]
+        assert stats["error_count"] == 12
+        assert [e["message"] for e in stats["recent_errors"]] == [
+            f"e{i}" for i in range(11, 1, -1)
+        ]
+
     def test_trends_present(self):
         self._add_recent_games(count=2)
         metrics = self.storage.compute_metrics("30d")
@@ -802,6 +924,15 @@ class TestPlaylistStats:
         result = self.storage.compute_playlist_stats(games)
         assert len(result) <= 5
 
+    def test_ties_break_by_name(self):
+        games = [
+            _make_game_record(playlist_names=[name])
+            for name in ("zeta", "beta", "zeta", "alpha", "gamma", "delta", "eta")
+        ]
+        with patch.object(self.storage, "_get_playlist_display_names", return_value={}):
+            result = self.storage.compute_playlist_stats(games)
+        assert [p["name"] for p in result] == ["zeta", "alpha", "beta", "delta", "eta"]
+
 
 # ---------------------------------------------------------------------------
 # TestLoadPrewarm — playlist display names must be pre-warmed via the executor
@@ -839,28 +970,38 @@ class TestLoadPrewarm:
         ]
         assert prewarm_calls, "load() must pre-warm playlist names via the executor"
 
+    @pytest.mark.asyncio
+    async def test_file_stat_and_read_run_in_executor(self):
+        """The exists() stat and the read+parse both run inside the executor
+        job, never directly on the event loop."""
+        self.storage._path = MagicMock()
+        self.storage._path.exists.return_value = False
+        seen_exists_in_executor = []
+
+        async def _exec(fn, *args):
+            calls_before = self.storage._path.exists.call_count
+            result = fn(*args)
+            if self.storage._path.exists.call_count > calls_before:
+                seen_exists_in_executor.append(fn.__name__)
+            return result
+
+        self.hass.async_add_executor_job = AsyncMock(side_effect=_exec)
+        await self.storage.load()
+
+        assert self.storage._path.exists.call_count == 1
+        assert seen_exists_in_executor == ["_read_file"]
+
     @pytest.mark.asyncio
     async def test_corruption_recovery_prewarms_via_executor(self):
         """After corruption recovery (JSONDecodeError branch) the cache must
         still be pre-warmed via the executor."""
-
-        def _raise_corrupt(_content):
-            raise json.JSONDecodeError("corrupt", "doc", 0)
-
         with (
             patch("custom_components.beatify.analytics.Path.exists", return_value=True),
             patch(
-                "custom_components.beatify.analytics.Path.read_text",
-                return_value="{ corrupt",
-            ),
-            patch(
-                "custom_components.beatify.analytics.json.loads",
-                side_effect=_raise_corrupt,
+                "custom_components.beatify.analytics.Path.read_bytes",
+                return_value=b"{ corrupt",
             ),
             patch.object(self.storage, "_save", new_callable=AsyncMock),
-            # _get_playlist_display_names globs playlist JSON; an empty glob
-            # keeps it from touching json.loads on real files.
-            patch("custom_components.beatify.analytics.Path.glob", return_value=[]),
         ):
             await self.storage.load()
 
@@ -878,17 +1019,30 @@ class TestLoadPrewarm:
 
     def test_missing_playlist_dir_caches_empty_result(self):
         """When the playlist dir is absent, the empty result must be cached so
-        the blocking exists() stat does not run on every subsequent call."""
+        the blocking directory scan does not run on every subsequent call."""
         with patch(
-            "custom_components.beatify.analytics.Path.exists", return_value=False
-        ) as mock_exists:
+            "custom_components.beatify.analytics.os.scandir",
+            side_effect=FileNotFoundError,
+        ) as mock_scandir:
             first = self.storage._get_playlist_display_names()
             assert first == {}
-            calls_after_first = mock_exists.call_count
-            # Second call must be a pure cache hit -> no further exists() stat.
+            assert mock_scandir.call_count == 1
+            # Second call must be a pure cache hit -> no further scan.
             second = self.storage._get_playlist_display_names()
             assert second == {}
-            assert mock_exists.call_count == calls_after_first
+            assert mock_scandir.call_count == 1
+
+    def test_reads_display_names_from_playlist_files(self, tmp_path):
+        (tmp_path / "pop-hits.json").write_text('{"name": "Pop Hits"}')
+        (tmp_path / "no-name.json").write_text("{}")
+        (tmp_path / "broken.json").write_text("{not json")
+        (tmp_path / "notes.txt").write_text("ignored")
+        self.hass.config.path.side_effect = lambda *_: str(tmp_path)
+
+        assert self.storage._get_playlist_display_names() == {
+            "pop-hits": "Pop Hits",
+            "no-name": "no-name",
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -1045,7 +1199,7 @@ class TestLoadUnreadableFile:
         ):
             self.storage._path = MagicMock()
             self.storage._path.exists.return_value = True
-            self.storage._path.read_text.side_effect = _boom
+            self.storage._path.read_bytes.side_effect = _boom
             self.hass.async_add_executor_job = AsyncMock(side_effect=_exec)
             # Must not raise.
             await self.storage.load()
@@ -1084,3 +1238,55 @@ class TestGamesOverTimeWeeklyClamp:
         assert sum(chart["values"]) == len(games)
         # The very-old game landed in the oldest (first) bucket.
         assert chart["values"][0] >= 1
+
+
+# ---------------------------------------------------------------------------
+# TestSaveSnapshot — the JSON encode runs off the event loop on a copy
+# ---------------------------------------------------------------------------
+
+
+class TestSaveSnapshot:
+    def setup_method(self):
+        self.hass = _mock_hass()
+        self.storage = AnalyticsStorage(self.hass)
+
+    def test_snapshot_is_decoupled_from_live_store(self):
+        self.storage._data["games"].append(_make_game_record(game_id="a"))
+        self.storage._data["monthly_summaries"].append(
+            {"month": "2024-01", "games_count": 1}
+        )
+        snapshot = self.storage._snapshot()
+
+        self.storage._data["games"].append(_make_game_record(game_id="b"))
+        self.storage._data["monthly_summaries"][0]["games_count"] = 2
+
+        assert [g["game_id"] for g in snapshot["games"]] == ["a"]
+        assert snapshot["monthly_summaries"][0]["games_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_save_writes_the_snapshot(self, tmp_path):
+        self.storage._path = tmp_path / "analytics.json"
+        self.storage._data["games"].append(_make_game_record(game_id="a"))
+
+        await self.storage._save()
+
+        on_disk = json.loads(self.storage._path.read_text())
+        assert [g["game_id"] for g in on_disk["games"]] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_save_fsyncs_temp_file_before_rename(self, tmp_path):
+        self.storage._path = tmp_path / "analytics.json"
+        calls = []
+        with (
+            patch(
+                "custom_components.beatify.analytics.os.fsync",
+                side_effect=lambda fd: calls.append("fsync"),
+            ),
+            patch(
+                "custom_components.beatify.analytics.os.replace",
+                side_effect=lambda src, dst: calls.append("replace"),
+            ),
+        ):
+            await self.storage._save()
+
+        assert calls == ["fsync", "replace"]
@@ -187,3 +187,14 @@ def test_both_challenges_award_same_bonus_to_fastest() -> None:
     assert movie.get_player_bonus("Alice") == CHALLENGE_BONUS_POINTS
     assert artist.get_player_bonus("Bob") == 0
     assert movie.get_player_bonus("Bob") == 0
+
+
+class TestGuessMatching:
+    def test_guesses_match_case_insensitively_after_trimming(self) -> None:
+        artist = ArtistChallenge(correct_artist="Die Ärzte", options=[])
+        movie = MovieChallenge(correct_movie="Straße", options=[])
+
+        assert artist.is_correct("  die ärzte ")
+        assert not artist.is_correct("Die Toten Hosen")
+        # casefold, not lower: "ß" folds to "ss".
+        assert movie.is_correct("STRASSE")
@@ -0,0 +1,96 @@
+"""Tests for the end-of-game highlights reel ranking (#75)."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.beatify.game.highlights import (
+    _EMOJI,
+    _PRIORITY,
+    HighlightsTracker,
+)
+
+
+def _types(tracker: HighlightsTracker, limit: int = 3) -> list[tuple[str, int]]:
+    return [(h.type, h.round) for h in tracker.get_top_highlights(limit)]
+
+
+def test_ranks_by_priority_then_round():
+    tracker = HighlightsTracker()
+    tracker.record_exact_match("A", "Song", 1990, 2)
+    tracker.record_streak("B", 3, 4)
+    tracker.record_photo_finish(["A", "B"], 5)
+    tracker.record_exact_match("C", "Song", 1991, 1)
+
+    assert _types(tracker, limit=4) == [
+        ("photo_finish", 5),
+        ("streak", 4),
+        ("exact_match", 1),
+        ("exact_match", 2),
+    ]
+
+
+def test_keeps_only_fastest_speed_record():
+    tracker = HighlightsTracker()
+    tracker.record_speed_record("A", 3.2, 1)
+    tracker.record_speed_record("B", 1.4, 2)
+    tracker.record_speed_record("C", 2.0, 3)
+    tracker.record_heartbreaker("A", "Song", 1, 4)
+    tracker.record_heartbreaker("B", "Song", 1, 5)
+
+    top = tracker.get_top_highlights(limit=8)
+
+    assert [(h.type, h.player) for h in top] == [
+        ("heartbreaker", "A"),
+        ("speed_record", "B"),
+    ]
+
+
+def test_limit_caps_reel_and_to_dict_uses_default():
+    tracker = HighlightsTracker()
+    for round_num in range(1, 11):
+        tracker.record_bet_win("A", 20, round_num)
+
+    assert _types(tracker, limit=2) == [("bet_win", 1), ("bet_win", 2)]
+    assert [h["round"] for h in tracker.to_dict()] == [1, 2, 3]
+
+
+def test_lookup_tables_are_read_only():
+    with pytest.raises(TypeError):
+        _PRIORITY["exact_match"] = 99  # type: ignore[index]
+    with pytest.raises(TypeError):
+        _EMOJI["streak"] = "x"  # type: ignore[index]
+
+
+def test_record_methods_attach_type_emoji():
+    tracker = HighlightsTracker()
+    tracker.record_exact_match("A", "Song", 1990, 1)
+    tracker.record_comeback("B", 3, 2)
+    tracker.record_photo_finish(["A", "B"], 3)
+
+    assert {h["type"]: h["emoji"] for h in tracker.to_dict()} == {
+        "exact_match": _EMOJI["exact_match"],
+        "comeback": _EMOJI["comeback"],
+        "photo_finish": _EMOJI["photo_finish"],
+    }
+
+
+def test_numeric_params_stay_numeric():
+    tracker = HighlightsTracker()
+    tracker.record_exact_match("A", "Song", 1990, 1)
+    tracker.record_speed_record("B", 4.04, 2)
+
+    params = {h["type"]: h["description_params"] for h in tracker.to_dict()}
+
+    assert params["exact_match"]["year"] == 1990
+    assert params["speed_record"]["time"] == "4.0"
+
+
+def test_record_uses_caller_timestamp_when_given():
+    tracker = HighlightsTracker()
+    tracker.record_streak("A", 3, 1, timestamp=1234.5)
+    tracker.record_streak("B", 5, 2)
+
+    stamped, sampled = tracker._highlights
+    assert stamped.timestamp == 1234.5
+    assert sampled.timestamp > 1234.5
@@ -894,6 +894,37 @@ class TestWledEndPreset:
 
         hass.services.async_call.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_apply_wled_finds_preset_select_on_same_device(self, monkeypatch):
+        """The preset select is resolved from the light's device entries."""
+        import homeassistant.helpers.entity_registry as er  # noqa: PLC0415
+
+        hass = _make_hass()
+        svc = PartyLightsService(hass)
+        registry = MagicMock()
+        registry.async_get.return_value = MagicMock(device_id="dev-1")
+        by_device = MagicMock(
+            return_value=[
+                MagicMock(domain="sensor", entity_id="sensor.strip_preset"),
+                MagicMock(domain="select", entity_id="select.strip_color"),
+                MagicMock(domain="select", entity_id="select.strip_preset"),
+            ]
+        )
+        monkeypatch.setattr(er, "async_get", MagicMock(return_value=registry))
+        monkeypatch.setattr(er, "async_entries_for_device", by_device, raising=False)
+
+        await svc._apply_wled("light.wled_strip", 3)
+
+        by_device.assert_called_once_with(
+            registry, "dev-1", include_disabled_entities=True
+        )
+        hass.services.async_call.assert_awaited_once_with(
+            "select",
+            "select_option",
+            {"entity_id": "select.strip_preset", "option": "3"},
+            blocking=False,
+        )
+
 
 # ---------------------------------------------------------------------------
 # _get_capability
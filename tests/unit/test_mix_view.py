@@ -146,6 +146,8 @@ def _view_with_catalogue(tmp_path: Path) -> MixPlaylistView:
     pdir = _write_catalogue(tmp_path)
     hass = MagicMock()
     hass.config.path = MagicMock(return_value=str(pdir))
+    # Real dict, as in HA: discovery memoises its parse in hass.data[DOMAIN].
+    hass.data = {}
     # Run executor jobs inline so discovery + file writes happen synchronously.
     hass.async_add_executor_job = AsyncMock(side_effect=lambda fn, *a: fn(*a))
     # async_discover_playlists uses asyncio.get_running_loop().run_in_executor;
@@ -9,6 +9,10 @@ runtime never even tries to play them.
 
 from __future__ import annotations
 
+from pathlib import Path
+
+import orjson
+
 from custom_components.beatify.const import (
     PROVIDER_AMAZON_MUSIC,
     PROVIDER_APPLE_MUSIC,
@@ -16,6 +20,10 @@ from custom_components.beatify.const import (
 )
 from custom_components.beatify.game.playlist import (
     PlaylistManager,
+    _compare_versions,
+    _get_bundled_playlist_version,
+    _get_playlist_version,
+    async_load_and_validate_playlist,
     filter_songs_for_provider,
     get_song_uri,
 )
@@ -273,6 +281,37 @@ class TestFilterSongsForProviderStorefront:
         assert len(filtered) == 1
         assert skipped == 0
 
+    def test_skips_are_logged_as_one_summary(self, caplog):
+        songs = [{"title": f"t{i}", "year": 1990} for i in range(5)]
+        songs.append({"title": "ok", "uri_apple_music": "applemusic://track/1"})
+
+        filtered, skipped = filter_songs_for_provider(songs, PROVIDER_APPLE_MUSIC)
+
+        assert [s["title"] for s in filtered] == ["ok"]
+        assert skipped == 5
+        warnings = [r for r in caplog.records if r.levelname == "WARNING"]
+        assert len(warnings) == 1
+        assert "Skipped 5 song(s)" in warnings[0].getMessage()
+
+    def test_manager_counts_storefront_and_missing_uri_skips_apart(self, caplog):
+        songs = [
+            {"title": "no uri", "year": 1990},
+            {
+                "title": "not in DE",
+                "uri_apple_music": "applemusic://track/us",
+                "uri_apple_music_by_region": {"de": None},
+            },
+            {"title": "ok", "uri_apple_music": "applemusic://track/ok"},
+        ]
+        caplog.set_level("INFO")
+
+        pm = PlaylistManager(songs, provider=PROVIDER_APPLE_MUSIC, storefront="de")
+
+        assert pm.get_remaining_count() == 1
+        messages = [r.getMessage() for r in caplog.records]
+        assert any("Skipped 1 song(s)" in m for m in messages)
+        assert any("Filtered 1 song(s)" in m for m in messages)
+
 
 # ---------------------------------------------------------------------------
 # Amazon Music — per-song identity (regression for #1361)
@@ -422,3 +461,120 @@ class TestPrecomputedUriEquivalence:
             "spotify:track:bbbbbbbbbbbbbbbbbbbbbb",
         }
         assert pm.get_next_song() is None
+
+
+class TestUnplayedPools:
+    """Selection draws from per-bucket unplayed pools kept in step by
+    mark_played (swap-pop) instead of rescanning the whole song list."""
+
+    @staticmethod
+    def _spotify(n: int, source: str) -> list[dict]:
+        return [
+            {
+                "uri_spotify": f"spotify:track:{source}{i:0>{22 - len(source)}}",
+                "title": f"{source}-{i}",
+                "_playlist_source": source,
+            }
+            for i in range(n)
+        ]
+
+    def test_multi_playlist_plays_every_song_exactly_once(self):
+        songs = self._spotify(7, "p1") + self._spotify(3, "p2")
+        pm = PlaylistManager(songs, provider=PROVIDER_SPOTIFY)
+
+        played = []
+        while (song := pm.get_next_song()) is not None:
+            played.append(song["_resolved_uri"])
+            pm.mark_played(song["_resolved_uri"])
+
+        assert sorted(played) == sorted(s["_precomputed_uri"] for s in songs)
+        assert pm.get_remaining_count() == 0
+
+    def test_unknown_or_repeated_uri_leaves_pool_intact(self):
+        pm = PlaylistManager(self._spotify(3, "p1"), provider=PROVIDER_SPOTIFY)
+        first = pm.get_next_song()
+        assert first is not None
+
+        pm.mark_played("spotify:track:not-in-this-playlist")
+        pm.mark_played(first["_resolved_uri"])
+        pm.mark_played(first["_resolved_uri"])
+
+        remaining = set()
+        while (song := pm.get_next_song()) is not None:
+            remaining.add(song["_resolved_uri"])
+            pm.mark_played(song["_resolved_uri"])
+        assert len(remaining) == 2
+        assert first["_resolved_uri"] not in remaining
+
+    def test_reset_refills_pools(self):
+        pm = PlaylistManager(self._spotify(2, "p1"), provider=PROVIDER_SPOTIFY)
+        for _ in range(2):
+            pm.mark_played(pm.get_next_song()["_resolved_uri"])
+        assert pm.get_next_song() is None
+
+        pm.reset()
+
+        assert pm.get_next_song() is not None
+        assert pm.get_remaining_count() == 2
+
+
+class TestPlaylistFileParsing:
+    """Playlist files are parsed from raw bytes; bad JSON still degrades."""
+
+    async def test_invalid_json_reports_error(self, tmp_path):
+        path = tmp_path / "broken.json"
+        path.write_bytes(b'{"name": "Broken", "songs": [')
+
+        data, errors = await async_load_and_validate_playlist(path)
+
+        assert data is None
+        assert len(errors) == 1
+        assert errors[0].startswith("Invalid JSON:")
+
+    def test_version_falls_back_for_unreadable_files(self, tmp_path):
+        good = tmp_path / "good.json"
+        good.write_text('{"version": "1.2", "name": "Caf\u00e9"}', encoding="utf-8")
+        broken = tmp_path / "broken.json"
+        broken.write_bytes(b"\xff not json")
+
+        assert _get_playlist_version(good) == "1.2"
+        assert _get_playlist_version(broken) == "0.0"
+        assert _get_playlist_version(tmp_path / "missing.json") == "0.0"
+
+    def test_version_from_head_matches_full_parse(self):
+        bundled = Path(__file__).parents[2] / "custom_components/beatify/playlists"
+        for path in bundled.glob("**/*.json"):
+            expected = orjson.loads(path.read_bytes()).get("version", "0.0")
+            assert _get_bundled_playlist_version(path) == expected, path.name
+
+    def test_version_inside_a_song_is_not_taken_for_the_playlist(self, tmp_path):
+        path = tmp_path / "late.json"
+        path.write_text(
+            '{"name": "Late", "songs": [{"version": "9.9"}], "version": "1.0"}',
+            encoding="utf-8",
+        )
+
+        assert _get_bundled_playlist_version(path) == "1.0"
+
+    def test_truncated_copy_reads_as_unversioned(self, tmp_path):
+        """A copy cut off mid-write keeps its header but must not count as
+        current — only the bundled source is read head-first."""
+        src = next(
+            (Path(__file__).parents[2] / "custom_components/beatify/playlists").glob(
+                "*.json"
+            )
+        )
+        content = src.read_bytes()
+        truncated = tmp_path / src.name
+        truncated.write_bytes(content[: len(content) // 2])
+
+        assert _get_bundled_playlist_version(truncated) != "0.0"
+        assert _get_playlist_version(truncated) == "0.0"
+
+    def test_compare_versions(self):
+        assert _compare_versions("1.10", "1.9") == 1
+        assert _compare_versions("1.2", "1.2.1") == -1
+        assert _compare_versions("2.0", "2.0") == 0
+        # Malformed on either side never triggers an overwrite.
+        assert _compare_versions("1.x", "0.1") == 0
+        assert _compare_versions("1.0", "") == 0
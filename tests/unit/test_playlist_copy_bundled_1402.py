@@ -13,6 +13,8 @@ exercised end-to-end.
 
 from __future__ import annotations
 
+import os
+
 from custom_components.beatify.game.playlist import _copy_bundled_playlists
 
 
@@ -42,3 +44,53 @@ async def test_copy_is_idempotent(tmp_path):
     second = {p.relative_to(dest) for p in dest.glob("**/*.json")}
 
     assert first == second
+
+
+async def test_one_failing_file_does_not_block_the_rest(tmp_path):
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    await _copy_bundled_playlists(dest)
+    copied = sorted(dest.glob("**/*.json"))
+    blocked, *others = copied
+
+    # A directory where a playlist file should be makes that one copy fail.
+    for path in copied:
+        path.unlink()
+    blocked.mkdir()
+
+    await _copy_bundled_playlists(dest)
+
+    assert blocked.is_dir()
+    assert all(path.is_file() for path in others)
+
+
+async def test_failed_copy_keeps_the_previous_file(tmp_path, monkeypatch):
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    await _copy_bundled_playlists(dest)
+    target = sorted(dest.glob("**/*.json"))[0]
+    target.write_text('{"version": "0.1", "songs": []}', encoding="utf-8")
+
+    def _fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", _fail_replace)
+    await _copy_bundled_playlists(dest)
+
+    # The old copy is untouched and no temp file is left next to it.
+    assert target.read_text(encoding="utf-8") == '{"version": "0.1", "songs": []}'
+    assert not list(dest.glob("**/*.tmp"))
+
+
+async def test_truncated_installed_copy_is_recopied(tmp_path):
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    await _copy_bundled_playlists(dest)
+    target = sorted(dest.glob("**/*.json"))[0]
+    original = target.read_bytes()
+    # An interrupted write leaves the header (and its "version") intact.
+    target.write_bytes(original[: len(original) // 2])
+
+    await _copy_bundled_playlists(dest)
+
+    assert target.read_bytes() == original
@@ -146,3 +146,58 @@ class TestDiscoveryCache:
         # Second call is a cache hit (empty signature unchanged).
         metas2, _ = await pl.async_discover_playlists_detailed(hass)
         assert metas2 is metas1
+
+    async def test_single_file_change_reparses_only_that_file(self, tmp_path):
+        """After one save, untouched files reuse their cached parse."""
+        pdir = _catalogue(tmp_path)
+        hass = _fake_hass(pdir)
+
+        _metas1, songs1 = await pl.async_discover_playlists_detailed(hass)
+        _write(pdir, "00s.json", "00s", ["2000s"], [_song("0007", 2004)])
+
+        with mock.patch.object(
+            pl, "validate_playlist", wraps=pl.validate_playlist
+        ) as spy:
+            metas2, songs2 = await pl.async_discover_playlists_detailed(hass)
+            assert spy.call_count == 1  # only the new file
+
+        assert {m["name"] for m in metas2} == {"00s", "80s", "90s"}
+        unchanged = str(pdir / "80s.json")
+        assert songs2[unchanged] is songs1[unchanged]
+
+    async def test_deleted_file_drops_out_of_cached_walk(self, tmp_path):
+        pdir = _catalogue(tmp_path)
+        hass = _fake_hass(pdir)
+
+        await pl.async_discover_playlists_detailed(hass)
+        (pdir / "90s.json").unlink()
+
+        metas, songs_by_path = await pl.async_discover_playlists_detailed(hass)
+        assert [m["name"] for m in metas] == ["80s"]
+        assert list(songs_by_path) == [str(pdir / "80s.json")]
+
+
+def test_provider_counts_validate_each_uri_field(tmp_path):
+    songs = [
+        _song("a"),
+        {**_song("b"), "uri": "not-a-uri", "uri_spotify": _song("c")["uri"]},
+        {
+            **_song("d"),
+            "uri": None,
+            "uri_apple_music": "applemusic://track/1",
+            "uri_youtube_music": "https://music.youtube.com/watch?v=abcdefghijk",
+            "uri_tidal": "tidal://track/2",
+            "uri_deezer": "deezer://track/bad",
+        },
+    ]
+    _write(tmp_path, "mixed.json", "Mixed", ["x"], songs)
+
+    meta, _ = pl._discover_playlist_file(tmp_path / "mixed.json", tmp_path)
+
+    assert meta is not None
+    assert meta["spotify_count"] == 2
+    assert meta["apple_music_count"] == 1
+    assert meta["youtube_music_count"] == 1
+    assert meta["tidal_count"] == 1
+    assert meta["deezer_count"] == 0
+    assert meta["amazon_music_count"] == 3
@@ -220,6 +220,7 @@ class TestUserSubdirIsCommunityInDiscovery:
 
         hass = MagicMock()
         hass.config.path = MagicMock(return_value=str(playlist_dir))
+        hass.data = {}
 
         results = await async_discover_playlists(hass)
         matching = [p for p in results if p["filename"] == "my-mix.json"]
@@ -15,6 +15,7 @@ from custom_components.beatify.game.scoring import (
     calculate_round_score,
     calculate_speed_multiplier,
     calculate_streak_bonus,
+    intro_qualified_times,
 )
 from custom_components.beatify.const import (
     DIFFICULTY_EASY,
@@ -22,6 +23,7 @@ from custom_components.beatify.const import (
     DIFFICULTY_NORMAL,
 )
 from custom_components.beatify.game.player import PlayerSession
+from custom_components.beatify.game.types import RoundAnalytics, get_decade_label
 
 
 # ---------------------------------------------------------------------------
@@ -695,6 +697,55 @@ class TestIntroBonusCorrectnessGate:
         assert late.intro_speed_bonuses == 0
 
 
+class TestIntroQualifiedTimes:
+    """The intro ranking is built once per round and ranked by bisection."""
+
+    def test_sorted_qualified_times_skip_wrong_late_and_eliminated(self):
+        """Only correct, in-time, non-eliminated submissions are ranked."""
+        out = _intro_player("Out", 2000, 0.1)
+        out.eliminated = True
+        players = [
+            _intro_player("B", 2000, 2.0),
+            _intro_player("Wrong", 1950, 0.5),
+            _intro_player("A", 2000, 1.0),
+            _intro_player("Late", 2000, 20.0),
+            out,
+        ]
+        times = intro_qualified_times(
+            players,
+            is_intro_round=True,
+            intro_round_start_time=_INTRO_ROUND_START,
+            correct_year=2000,
+            difficulty="normal",
+            title_artist_manager=None,
+        )
+        assert times == [_INTRO_ROUND_START + 1.0, _INTRO_ROUND_START + 2.0]
+
+    def test_empty_outside_intro_round(self):
+        times = intro_qualified_times(
+            [_intro_player("A", 2000, 1.0)],
+            is_intro_round=False,
+            intro_round_start_time=_INTRO_ROUND_START,
+            correct_year=2000,
+            difficulty="normal",
+            title_artist_manager=None,
+        )
+        assert times == []
+
+    def test_tied_submissions_share_a_tier(self):
+        """Exact ties count nobody as strictly earlier, so both get the tier."""
+        first = _intro_player("First", 2000, 1.0)
+        tie_a = _intro_player("TieA", 2000, 2.0)
+        tie_b = _intro_player("TieB", 2000, 2.0)
+        last = _intro_player("Last", 2000, 3.0)
+        _score_intro_year([last, tie_b, first, tie_a])
+
+        assert first.intro_bonus == 5
+        assert tie_a.intro_bonus == tie_b.intro_bonus == 3
+        # Three players submitted before Last, so the tiers are exhausted.
+        assert last.intro_bonus == 0
+
+
 # ---------------------------------------------------------------------------
 # Title & Artist mode scoring (Issue #1180)
 # ---------------------------------------------------------------------------
@@ -998,3 +1049,88 @@ class TestTitleArtistSuperlatives:
         name_dropper = next(a for a in awards if a["id"] == "name_dropper")
         assert name_dropper["player_name"] == "Bob"
         assert name_dropper["value"] == 5
+
+
+class TestClutchPlayer:
+    """Clutch Player ranks the sum of each player's last three rounds."""
+
+    def test_final_three_score_needs_three_rounds(self):
+        p = PlayerSession(name="Alice", ws=MagicMock())
+        p.round_scores = [10, 20]
+        assert p.final_three_score == 0
+        p.round_scores.append(5)
+        assert p.final_three_score == 35
+
+    def test_awarded_on_last_three_rounds_only(self):
+        early = PlayerSession(name="Alice", ws=MagicMock())
+        early.round_scores = [30, 30, 30, 0, 0, 5]
+        late = PlayerSession(name="Bob", ws=MagicMock())
+        late.round_scores = [0, 0, 0, 5, 5, 5]
+        awards = ScoringService.calculate_superlatives([early, late], rounds_played=6)
+        clutch = next(a for a in awards if a["id"] == "clutch_player")
+        assert clutch["player_name"] == "Bob"
+        assert clutch["value"] == 15
+
+
+class TestSpeedDemon:
+    """Speed Demon goes to the lowest average among qualifying players."""
+
+    def test_fastest_qualifying_average_wins(self):
+        quick = PlayerSession(name="Alice", ws=MagicMock())
+        quick.submission_times = [2.0, 3.0, 4.0]
+        too_few = PlayerSession(name="Bob", ws=MagicMock())
+        too_few.submission_times = [0.5, 0.5]
+        slow = PlayerSession(name="Cara", ws=MagicMock())
+        slow.submission_times = [8.0, 9.0, 10.0]
+
+        assert too_few.avg_submission_time is None
+        awards = ScoringService.calculate_superlatives(
+            [quick, too_few, slow], rounds_played=3
+        )
+        speed = next(a for a in awards if a["id"] == "speed_demon")
+        assert speed["player_name"] == "Alice"
+        assert speed["value"] == 3.0
+
+
+class TestComebackKing:
+    """Comeback King compares second-half to first-half round averages."""
+
+    def test_biggest_improvement_wins(self):
+        riser = PlayerSession(name="Alice", ws=MagicMock())
+        riser.round_scores = [0, 0, 2, 10, 20, 20, 20]  # 0.67 -> 17.5
+        steady = PlayerSession(name="Bob", ws=MagicMock())
+        steady.round_scores = [10] * 7
+
+        awards = ScoringService.calculate_superlatives([riser, steady], rounds_played=7)
+        comeback = next(a for a in awards if a["id"] == "comeback_king")
+        assert comeback["player_name"] == "Alice"
+        assert comeback["value"] == 16.8
+
+
+# ---------------------------------------------------------------------------
+# get_decade_label
+# ---------------------------------------------------------------------------
+
+
+class TestDecadeLabel:
+    def test_labels_from_table_and_fallback(self):
+        assert get_decade_label(1985) == "1980s"
+        assert get_decade_label(2000) == "2000s"
+        assert get_decade_label(2099) == "2090s"
+        # Outside the precomputed range the label is still formatted.
+        assert get_decade_label(2105) == "2100s"
+        assert get_decade_label(-5) == "-10s"
+
+
+class TestRoundAnalyticsToDict:
+    def test_zero_average_is_kept(self):
+        """A 0.0 average is a real value, not a missing one."""
+        assert RoundAnalytics(average_guess=0.0).to_dict()["average_guess"] == 0.0
+
+    def test_missing_average_is_none(self):
+        assert RoundAnalytics().to_dict()["average_guess"] is None
+
+    def test_average_rounded_to_one_decimal(self):
+        assert (
+            RoundAnalytics(average_guess=1987.46).to_dict()["average_guess"] == 1987.5
+        )
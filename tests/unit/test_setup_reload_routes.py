@@ -130,14 +130,19 @@ def _patch_heavy_helpers(monkeypatch):
     stats.load = AsyncMock()
     stats.async_shutdown = AsyncMock()  # #1708: flushed on unload
     stats.games_played = 0
-    monkeypatch.setattr(beatify_init, "StatsService", MagicMock(return_value=stats))
+    # Both are imported inside async_setup_entry, so patch them at their source.
+    monkeypatch.setattr(
+        "custom_components.beatify.services.stats.StatsService",
+        MagicMock(return_value=stats),
+    )
 
     analytics = MagicMock()
     analytics.load = AsyncMock()
     analytics.async_shutdown = AsyncMock()
     analytics.total_games = 0
     monkeypatch.setattr(
-        beatify_init, "AnalyticsStorage", MagicMock(return_value=analytics)
+        "custom_components.beatify.analytics.AnalyticsStorage",
+        MagicMock(return_value=analytics),
     )
 
 
@@ -244,3 +249,53 @@ async def test_unload_entry_returns_false_and_skips_cleanup_on_failure(mock_hass
     assert await beatify_init.async_unload_entry(mock_hass, entry) is False
     # On failure the domain data must remain in place (entities still exist).
     assert DOMAIN in mock_hass.data
+
+
+def test_view_classes_resolve_lazily_as_package_attributes():
+    """View classes stay reachable on the package without an eager import."""
+    from custom_components.beatify.server.views import AdminView
+
+    assert beatify_init.AdminView is AdminView
+    assert "AdminView" in vars(beatify_init)  # cached after first access
+    with pytest.raises(AttributeError):
+        beatify_init.NotAView  # noqa: B018
+
+
+@pytest.mark.asyncio
+async def test_registers_every_view_in_table_order(mock_hass):
+    """Route registration walks _VIEW_NAMES — one instance per name, in order."""
+    await beatify_init.async_setup_entry(mock_hass, _make_entry())
+
+    registered = tuple(type(v).__name__ for v in mock_hass._registered_views)
+    assert registered == beatify_init._VIEW_NAMES
+
+
+@pytest.mark.asyncio
+async def test_setup_keeps_discovery_cache_written_during_setup(mock_hass, monkeypatch):
+    """Setup fills in hass.data[DOMAIN] instead of dropping the #1704 cache."""
+    cache = {"sig": "sig", "metas": [], "songs_by_path": {}}
+
+    async def _discover(hass):
+        hass.data.setdefault(DOMAIN, {})["_playlist_discovery_cache"] = cache
+        return []
+
+    monkeypatch.setattr(beatify_init, "async_discover_playlists", _discover)
+    await beatify_init.async_setup_entry(mock_hass, _make_entry())
+
+    assert mock_hass.data[DOMAIN]["_playlist_discovery_cache"] is cache
+    assert mock_hass.data[DOMAIN]["entry_id"] == "entry-1"
+
+
+@pytest.mark.asyncio
+async def test_stop_event_flushes_analytics_and_stats(mock_hass):
+    """HA does not unload entries on stop, so setup flushes saves from the
+    stop event instead."""
+    await beatify_init.async_setup_entry(mock_hass, _make_entry())
+
+    mock_hass.bus.async_listen_once.assert_called_once()
+    event_type, flush = mock_hass.bus.async_listen_once.call_args.args
+    assert event_type is beatify_init.EVENT_HOMEASSISTANT_STOP
+
+    await flush(MagicMock())
+    mock_hass.data[DOMAIN]["analytics"].async_shutdown.assert_awaited_once()
+    mock_hass.data[DOMAIN]["stats"].async_shutdown.assert_awaited_once()
@@ -8,7 +8,12 @@ unconfigured on a new device.
 
 from __future__ import annotations
 
-from custom_components.beatify.server.serializers import _is_setup_complete
+from unittest.mock import MagicMock
+
+from custom_components.beatify.server.serializers import (
+    _is_setup_complete,
+    build_status_response,
+)
 
 
 def test_none_blob_is_incomplete():
@@ -42,3 +47,15 @@ def test_player_and_playlist_is_complete():
         "game_settings": {"selectedPlaylists": [{"path": "80s.json"}]},
     }
     assert _is_setup_complete(blob) is True
+
+
+def test_status_music_assistant_flag_uses_domain_lookup():
+    hass = MagicMock()
+    hass.data = {}
+    hass.config_entries.async_entries.return_value = [MagicMock()]
+
+    status = build_status_response(hass, version="1.0", media_players=[], playlists=[])
+
+    assert status["has_music_assistant"] is True
+    assert status["setup_complete"] is False
+    hass.config_entries.async_entries.assert_called_once_with("music_assistant")
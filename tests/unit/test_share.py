@@ -0,0 +1,38 @@
+"""Tests for the end-of-game share card (Issue #120)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.beatify.game.player import PlayerSession
+from custom_components.beatify.game.share import build_emoji_grid, build_share_data
+
+
+def _player(results: list[str]) -> PlayerSession:
+    player = PlayerSession(name="Ann", ws=MagicMock())
+    player.round_results = results
+    player.score = 42
+    return player
+
+
+def test_emoji_grid_counts_scored_and_exact_rounds():
+    player = _player(["exact", "scored", "close", "missed", "exact", "skipped"])
+
+    grid = build_emoji_grid(player, "80s Hits", 6)
+
+    assert "🟣🟢🟡🔴🟣⬜" in grid
+    assert "4/6 correct" in grid
+    assert "🎯 2 Exact" in grid
+
+
+def test_share_data_derives_playlist_name_from_path_or_file_name():
+    for path in ("/config/beatify/playlists/disco-funk.json", "disco-funk.json"):
+        game_state = SimpleNamespace(
+            playlists=[path], round=3, players={"id": _player(["exact"])}
+        )
+
+        data = build_share_data(game_state)
+
+        assert data["playlist_name"] == "Disco Funk"
+        assert set(data["emoji_grids"]) == {"Ann"}
@@ -575,6 +575,13 @@ class TestAddPlayer:
         assert ok is False
         assert err == ERR_NAME_TAKEN
 
+    def test_player_session_rejects_undeclared_attributes(self):
+        self.state.add_player("Alice", MagicMock())
+        player = self.state.get_player("Alice")
+        assert not hasattr(player, "__dict__")
+        with pytest.raises(AttributeError):
+            player.not_a_field = 1
+
     def test_empty_name_rejected(self):
         ok, err = self.state.add_player("", MagicMock())
         assert ok is False
@@ -706,6 +713,14 @@ class TestAllSubmitted:
         self.state.players.clear()
         assert self.state.all_submitted() is False
 
+    def test_submission_status_counts_every_submitter(self):
+        # The count includes a disconnected submitter; the flag ignores them.
+        self.state.get_player("Bob").connected = False
+        self.state.get_player("Bob").submitted = True
+        assert self.state.submission_status() == (1, False)
+        self.state.get_player("Alice").submitted = True
+        assert self.state.submission_status() == (2, True)
+
 
 # ---------------------------------------------------------------------------
 # GameState.get_leaderboard